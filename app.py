@@ -1,11 +1,43 @@
-from flask import Flask, request, jsonify
+from flask import Flask, g, request, jsonify
+from flask.json.provider import JSONProvider
+import logging
+import orjson
 import os
+import threading
+import time
+from werkzeug.exceptions import HTTPException
 from services.box_service.box_service import BoxService
 from services.screen_service.screen_service import ScreenService
 from services.config_service.config_service import ConfigService
 from services.cisco_worker.cisco_worker import CiscoWorker
 
+
+class OrJSONProvider(JSONProvider):
+    """JSON provider backed by orjson for faster serialization of large payloads"""
+
+    # orjson always emits compact output and preserves insertion order, so
+    # Flask's pretty-print and key-sorting defaults never apply to responses
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj, **kwargs):
+        # OPT_NON_STR_KEYS coerces int dict keys to strings like stdlib json
+        # (the ports_vlans payload is keyed by box/screen ids)
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'),
+                    format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
+app.json = OrJSONProvider(app)
+# Request bodies here are tiny key/value documents; reject anything larger
+# before it is buffered or parsed (Werkzeug answers 413 from Content-Length)
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
 
 # Initialize services
 box_service = BoxService()
@@ -15,7 +47,8 @@ config_service = ConfigService()
 # Initialize Cisco worker
 # Get serial port from database, fallback to environment variable or default
 serial_port = config_service.get_serial_port(os.getenv('CISCO_SERIAL_PORT', 'COM4'))
-cisco_worker = CiscoWorker(serial_port=serial_port)
+cisco_worker = CiscoWorker(serial_port=serial_port,
+                           box_service=box_service, screen_service=screen_service)
 
 # Error messages
 ERROR_BOX_NOT_FOUND = 'Box not found'
@@ -29,23 +62,118 @@ ERROR_SCREEN_ALREADY_ASSIGNED = 'Screen is already assigned to another box'
 ERROR_BOX_ALREADY_HAS_SCREEN = 'Box is already assigned to another screen'
 ERROR_SCREEN_ALREADY_FREE = 'Screen is already free'
 
+# Pre-serialized error bodies keyed by message
+_error_cache = {}
+
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """Last-resort handler: log the traceback and return a JSON 500"""
+    if isinstance(error, HTTPException):
+        return error
+    logger.exception("Unhandled error")
+    return jsonify({'error': f'Internal server error: {error}'}), 500
+
+
+# Short-lived cache for expensive switch queries so burst polling from the
+# dashboard collapses to a single serial round-trip per TTL window
+SWITCH_CACHE_TTL = 2.0
+_switch_cache = {}
+
+
+def get_switch_cached(key, fetch):
+    """Return a cached switch query result, refreshing it when the TTL expires"""
+    now = time.monotonic()
+    entry = _switch_cache.get(key)
+    if entry and now - entry[0] < SWITCH_CACHE_TTL:
+        return entry[1]
+    value = fetch()
+    _switch_cache[key] = (now, value)
+    return value
+
+
+def invalidate_switch_cache():
+    """Drop cached switch query results after the switch state changes"""
+    _switch_cache.clear()
+
+
+def error_response(message, status):
+    """Return a pre-serialized JSON error response (encoded once per message)"""
+    body = _error_cache.get(message)
+    if body is None:
+        body = orjson.dumps({'error': message})
+        _error_cache[message] = body
+    return app.response_class(body, status=status, mimetype='application/json')
+
+
+# Encode the standard error bodies once at import so even a handler's first
+# failure response serves frozen bytes; dynamic messages memoize on first use
+for _message in (ERROR_BOX_NOT_FOUND, ERROR_USER_NOT_FOUND, ERROR_BOX_ALREADY_FREE,
+                 ERROR_BOX_ALREADY_ASSIGNED, ERROR_NO_FREE_BOXES,
+                 ERROR_REQUEST_BODY_REQUIRED, ERROR_SCREEN_NOT_FOUND,
+                 ERROR_SCREEN_ALREADY_ASSIGNED, ERROR_BOX_ALREADY_HAS_SCREEN,
+                 ERROR_SCREEN_ALREADY_FREE):
+    _error_cache[_message] = orjson.dumps({'error': _message})
+
+
+def get_body():
+    """Parse the JSON request body at most once per request and memoize it on g"""
+    if not hasattr(g, '_json_body'):
+        g._json_body = request.get_json(silent=True)
+    return g._json_body
+
+
+def require_fields(data, *fields):
+    """Validate that the body exists and provides every field. Returns an error message or None"""
+    if not data:
+        return ERROR_REQUEST_BODY_REQUIRED
+    for field in fields:
+        if data.get(field) is None:
+            return f'{field} is required'
+    return None
+
+
+def stream_json_list(items):
+    """Stream a JSON array one element at a time instead of buffering the full payload"""
+    def generate():
+        yield b'['
+        first = True
+        for item in items:
+            if not first:
+                yield b','
+            yield orjson.dumps(item)
+            first = False
+        yield b']'
+    return app.response_class(generate(), mimetype='application/json')
+
+
+def reset_screen_port(screen_port):
+    """Queue a reset of a screen port back to the default screen VLAN"""
+    if screen_port:
+        logger.info(f"Resetting screen port {screen_port} to default VLAN {cisco_worker.default_screen_vlan}")
+        cisco_worker.submit_port_to_vlan(screen_port, cisco_worker.default_screen_vlan)
+
+
+def build_box_assignment_payload(box, user_id):
+    """Build the standard box-assignment response payload"""
+    return {
+        'box_id': box['box_id'],
+        'box_number': box.get('box_number', ''),
+        'user_id': user_id,
+        'port_number': box['port_number']
+    }
+
 
-@app.route('/boxes', methods=['POST'])
 def add_box():
     """Add a new box"""
-    data = request.get_json()
-    
-    if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+    data = get_body()
     
-    if 'port_number' not in data:
-        return jsonify({'error': 'port_number is required'}), 400
+    error = require_fields(data, 'port_number', 'box_number', 'vlan_number')
+    if error:
+        return error_response(error, 400)
     
-    if 'box_number' not in data:
-        return jsonify({'error': 'box_number is required'}), 400
-    
-    if 'vlan_number' not in data or not data['vlan_number']:
-        return jsonify({'error': 'vlan_number is required'}), 400
+    if not data['vlan_number']:
+        return error_response('vlan_number is required', 400)
     
     port_number = data['port_number']
     box_number = data['box_number']
@@ -57,24 +185,23 @@ def add_box():
     return jsonify(new_box), 201
 
 
-@app.route('/boxes/<int:box_id>', methods=['DELETE'])
 def delete_box(box_id):
     """Delete a box"""
     deleted = box_service.delete_box(box_id)
     
     if not deleted:
-        return jsonify({'error': ERROR_BOX_NOT_FOUND}), 404
+        return error_response(ERROR_BOX_NOT_FOUND, 404)
     
     return jsonify({'message': 'Box deleted successfully'}), 200
 
 
-@app.route('/boxes/assign', methods=['POST'])
 def assign_box():
     """Assign a user to a box"""
-    data = request.get_json()
+    data = get_body()
     
-    if not data or 'user_id' not in data:
-        return jsonify({'error': 'user_id is required'}), 400
+    error = require_fields(data, 'user_id')
+    if error:
+        return error_response(error, 400)
     
     user_id = data['user_id']
     box_id = data.get('box_id')
@@ -88,37 +215,27 @@ def assign_box():
         if not box:
             # Check if box exists
             if not box_service.get_box_by_id(box_id):
-                return jsonify({'error': ERROR_BOX_NOT_FOUND}), 404
+                return error_response(ERROR_BOX_NOT_FOUND, 404)
             else:
-                return jsonify({'error': ERROR_BOX_ALREADY_ASSIGNED}), 400
+                return error_response(ERROR_BOX_ALREADY_ASSIGNED, 400)
         
-        return jsonify({
-            'box_id': box['box_id'],
-            'box_number': box.get('box_number', ''),
-            'user_id': user_id,
-            'port_number': box['port_number']
-        }), 200
+        return jsonify(build_box_assignment_payload(box, user_id)), 200
     else:
         # Find and assign to any free box
         box = box_service.assign_user_to_any_free_box(user_id)
         if not box:
-            return jsonify({'error': ERROR_NO_FREE_BOXES}), 404
+            return error_response(ERROR_NO_FREE_BOXES, 404)
         
-        return jsonify({
-            'box_id': box['box_id'],
-            'box_number': box.get('box_number', ''),
-            'user_id': user_id,
-            'port_number': box['port_number']
-        }), 200
+        return jsonify(build_box_assignment_payload(box, user_id)), 200
 
 
-@app.route('/boxes/assign_user_to_free_box', methods=['POST'])
 def assign_user_to_free_box():
     """Assign a user to any free box"""
-    data = request.get_json()
+    data = get_body()
     
-    if not data or 'user_id' not in data:
-        return jsonify({'error': 'user_id is required'}), 400
+    error = require_fields(data, 'user_id')
+    if error:
+        return error_response(error, 400)
     
     user_id = data['user_id']
     
@@ -128,35 +245,29 @@ def assign_user_to_free_box():
     # Find and assign to any free box
     box = box_service.assign_user_to_any_free_box(user_id)
     if not box:
-        return jsonify({'error': ERROR_NO_FREE_BOXES}), 404
+        return error_response(ERROR_NO_FREE_BOXES, 404)
     
-    return jsonify({
-        'box_id': box['box_id'],
-        'box_number': box.get('box_number', ''),
-        'user_id': user_id,
-        'port_number': box['port_number']
-    }), 200
+    return jsonify(build_box_assignment_payload(box, user_id)), 200
 
 
-@app.route('/boxes/unassign', methods=['POST'])
 def unassign_box():
     """Unassign a user from a box"""
-    data = request.get_json()
+    data = get_body()
     
     if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+        return error_response(ERROR_REQUEST_BODY_REQUIRED, 400)
     
     user_id = data.get('user_id')
     box_id = data.get('box_id')
     
     if user_id is None and box_id is None:
-        return jsonify({'error': 'Either user_id or box_id is required'}), 400
+        return error_response('Either user_id or box_id is required', 400)
     
     if user_id is not None:
         # Unassign by user_id
         unassigned = box_service.unassign_user_from_box(user_id)
         if not unassigned:
-            return jsonify({'error': ERROR_USER_NOT_FOUND}), 404
+            return error_response(ERROR_USER_NOT_FOUND, 404)
         
         return jsonify({'message': 'User unassigned from box successfully'}), 200
     
@@ -164,28 +275,23 @@ def unassign_box():
         # Unassign by box_id
         result = box_service.unassign_box(box_id)
         if result is None:
-            return jsonify({'error': ERROR_BOX_NOT_FOUND}), 404
+            return error_response(ERROR_BOX_NOT_FOUND, 404)
         if result is False:
-            return jsonify({'error': ERROR_BOX_ALREADY_FREE}), 400
+            return error_response(ERROR_BOX_ALREADY_FREE, 400)
         
         return jsonify({'message': 'Box unassigned successfully'}), 200
 
 
-@app.route('/boxes/free', methods=['GET'])
 def get_free_boxes():
     """Get all free boxes"""
-    free_boxes = box_service.get_free_boxes()
-    return jsonify(free_boxes), 200
+    return stream_json_list(box_service.get_free_boxes())
 
 
-@app.route('/boxes', methods=['GET'])
 def get_all_boxes():
     """Get all boxes"""
-    all_boxes = box_service.get_all_boxes()
-    return jsonify(all_boxes), 200
+    return stream_json_list(box_service.get_all_boxes())
 
 
-@app.route('/boxes/user/<user_id>', methods=['GET'])
 def get_user_box(user_id):
     """Get box assigned to a specific user"""
     
@@ -193,22 +299,15 @@ def get_user_box(user_id):
     if not box:
         return jsonify({'has_box': False}), 200
     
-    return jsonify({
-        'has_box': True,
-        'box_id': box['box_id'],
-        'box_number': box.get('box_number', ''),
-        'user_id': user_id,
-        'port_number': box['port_number']
-    }), 200
+    return jsonify({'has_box': True, **build_box_assignment_payload(box, user_id)}), 200
 
 
-@app.route('/boxes/<int:box_id>', methods=['PUT', 'PATCH'])
 def update_box(box_id):
     """Update box attributes"""
-    data = request.get_json()
+    data = get_body()
     
     if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+        return error_response(ERROR_REQUEST_BODY_REQUIRED, 400)
     
     # Extract updatable fields
     box_number = data.get('box_number')
@@ -217,29 +316,26 @@ def update_box(box_id):
     
     # Check if at least one field is provided
     if box_number is None and port_number is None and vlan_number is None:
-        return jsonify({'error': 'At least one field (box_number, port_number, or vlan_number) must be provided'}), 400
+        return error_response('At least one field (box_number, port_number, or vlan_number) must be provided', 400)
     
     # Update the box
     updated_box = box_service.update_box(box_id, box_number=box_number, port_number=port_number, vlan_number=vlan_number)
     
     if not updated_box:
-        return jsonify({'error': ERROR_BOX_NOT_FOUND}), 404
+        return error_response(ERROR_BOX_NOT_FOUND, 404)
     
     return jsonify(updated_box), 200
 
 
 # Screen endpoints
 
-@app.route('/screens', methods=['POST'])
 def add_screen():
     """Add a new screen"""
-    data = request.get_json()
-    
-    if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+    data = get_body()
     
-    if 'port_number' not in data:
-        return jsonify({'error': 'port_number is required'}), 400
+    error = require_fields(data, 'port_number')
+    if error:
+        return error_response(error, 400)
     
     port_number = data['port_number']
     vlan_number = data.get('vlan_number')
@@ -251,129 +347,109 @@ def add_screen():
     return jsonify(new_screen), 201
 
 
-@app.route('/screens/<int:screen_id>', methods=['DELETE'])
 def delete_screen(screen_id):
     """Delete a screen"""
     deleted = screen_service.delete_screen(screen_id)
     
     if not deleted:
-        return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+        return error_response(ERROR_SCREEN_NOT_FOUND, 404)
     
     return jsonify({'message': 'Screen deleted successfully'}), 200
 
 
-@app.route('/screens', methods=['GET'])
 def get_all_screens():
     """Get all screens"""
-    all_screens = screen_service.get_all_screens()
-    return jsonify(all_screens), 200
+    return stream_json_list(screen_service.get_all_screens())
 
 
-@app.route('/screens/free', methods=['GET'])
 def get_free_screens():
     """Get all free screens"""
-    free_screens = screen_service.get_free_screens()
-    return jsonify(free_screens), 200
+    return stream_json_list(screen_service.get_free_screens())
 
 
-@app.route('/screens/<int:screen_id>', methods=['GET'])
 def get_screen(screen_id):
     """Get a specific screen by ID"""
     screen = screen_service.get_screen_by_id(screen_id)
     
     if not screen:
-        return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+        return error_response(ERROR_SCREEN_NOT_FOUND, 404)
     
     return jsonify(screen), 200
 
 
-@app.route('/screens/assign', methods=['POST'])
 def assign_box_to_screen():
     """Assign a box to a screen (1-to-1 relation)"""
-    data = request.get_json()
+    data = get_body()
     
-    if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
-    
-    box_id = data.get('box_id')
-    screen_id = data.get('screen_id')
+    error = require_fields(data, 'box_id', 'screen_id')
+    if error:
+        return error_response(error, 400)
     
-    if box_id is None or screen_id is None:
-        return jsonify({'error': 'Both box_id and screen_id are required'}), 400
+    box_id = data['box_id']
+    screen_id = data['screen_id']
     
     # Check if box exists
     box = box_service.get_box_by_id(box_id)
     if not box:
-        return jsonify({'error': ERROR_BOX_NOT_FOUND}), 404
-    
-    # Assign box to screen
-    screen = screen_service.assign_box_to_screen(box_id, screen_id)
-    if not screen:
-        # Check if screen exists
-        if not screen_service.get_screen_by_id(screen_id):
-            return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
-        # Check if screen is already assigned
-        existing_screen = screen_service.get_screen_by_id(screen_id)
-        if existing_screen and existing_screen.get('box_id') is not None:
-            return jsonify({'error': ERROR_SCREEN_ALREADY_ASSIGNED}), 400
-        # Check if box is already assigned to another screen
-        existing_screen_for_box = screen_service.get_screen_by_box_id(box_id)
-        if existing_screen_for_box:
-            return jsonify({'error': ERROR_BOX_ALREADY_HAS_SCREEN}), 400
-    
-    # Physically assign screen port to box's VLAN on the switch
-    if screen and box:
-        screen_port = screen.get('port_number')
-        box_vlan = box.get('vlan_number')
-        
-        if screen_port and box_vlan:
-            try:
-                if cisco_worker.connection and cisco_worker.connection.is_open:
-                    success = cisco_worker.assign_port_to_vlan(screen_port, box_vlan)
-                    if not success:
-                        print(f"Warning: Failed to assign screen port {screen_port} to box VLAN {box_vlan} on switch")
-            except Exception as e:
-                print(f"Error assigning screen port to box VLAN on switch: {e}")
+        return error_response(ERROR_BOX_NOT_FOUND, 404)
+    
+    # Assign box to screen; the tagged result says why it failed without
+    # any follow-up queries
+    status, screen = screen_service.try_assign_box_to_screen(box_id, screen_id)
+    if status == 'screen_missing':
+        return error_response(ERROR_SCREEN_NOT_FOUND, 404)
+    if status == 'screen_taken':
+        return error_response(ERROR_SCREEN_ALREADY_ASSIGNED, 400)
+    if status == 'box_taken':
+        return error_response(ERROR_BOX_ALREADY_HAS_SCREEN, 400)
+
+    # Physically assign screen port to box's VLAN on the switch (queued for
+    # the background worker so the handler does not block on serial I/O)
+    screen_port = screen.get('port_number')
+    box_vlan = box.get('vlan_number')
+
+    if screen_port and box_vlan:
+        cisco_worker.submit_port_to_vlan(screen_port, box_vlan)
     
     return jsonify(screen), 200
 
 
-@app.route('/screens/assign_user', methods=['POST'])
 def assign_user_to_screen():
     """Assign a user's box to a screen. If screen is already assigned, reassign it."""
-    data = request.get_json()
+    data = get_body()
     
-    if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+    error = require_fields(data, 'screen_id', 'user_id')
+    if error:
+        return error_response(error, 400)
     
-    screen_id = data.get('screen_id')
-    user_id = data.get('user_id')
-    
-    if screen_id is None or user_id is None:
-        return jsonify({'error': 'Both screen_id and user_id are required'}), 400
+    screen_id = data['screen_id']
+    user_id = data['user_id']
     
-    print(f"[INFO] Assigning user {user_id} to screen {screen_id}")
+    logger.info(f"Assigning user {user_id} to screen {screen_id}")
     
     # Check if screen exists
     screen = screen_service.get_screen_by_id(screen_id)
     if not screen:
-        print(f"[ERROR] Screen {screen_id} not found")
-        return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+        logger.error(f"Screen {screen_id} not found")
+        return error_response(ERROR_SCREEN_NOT_FOUND, 404)
     
     # Get the box assigned to the user
     box = box_service.get_box_by_user_id(user_id)
     if not box:
-        print(f"[ERROR] User {user_id} has no assigned box")
-        return jsonify({'error': ERROR_USER_NOT_FOUND}), 400
+        logger.error(f"User {user_id} has no assigned box")
+        return error_response(ERROR_USER_NOT_FOUND, 400)
     
     box_id = box['box_id']
-    print(f"[INFO] User {user_id} has box {box_id} (Box Number: {box.get('box_number')})")
+    logger.info(f"User {user_id} has box {box_id} (Box Number: {box.get('box_number')})")
+    
+    # Collect every switch update and apply them as one CLI transaction
+    switch_updates = []
     
     # If screen is already assigned to a different box, unassign it first
     if screen.get('box_id') is not None and screen.get('box_id') != box_id:
         old_box_id = screen.get('box_id')
         old_box = box_service.get_box_by_id(old_box_id)
-        print(f"[INFO] Screen {screen_id} is assigned to different box {old_box_id}, unassigning...")
+        logger.info(f"Screen {screen_id} is assigned to different box {old_box_id}, unassigning...")
         
         # Unassign the screen from the old box
         screen_service.unassign_screen(screen_id)
@@ -382,19 +458,15 @@ def assign_user_to_screen():
         if old_box:
             old_box_port = old_box.get('port_number')
             if old_box_port:
-                try:
-                    if cisco_worker.connection and cisco_worker.connection.is_open:
-                        default_vlan = old_box.get('vlan_number') or cisco_worker.default_box_vlan
-                        print(f"[INFO] Resetting old box port {old_box_port} to VLAN {default_vlan}")
-                        cisco_worker.assign_port_to_vlan(old_box_port, default_vlan)
-                except Exception as e:
-                    print(f"[ERROR] Error resetting old box port VLAN on switch: {e}")
+                default_vlan = old_box.get('vlan_number') or cisco_worker.default_box_vlan
+                logger.info(f"Resetting old box port {old_box_port} to VLAN {default_vlan}")
+                switch_updates.append((old_box_port, default_vlan))
     
     # If the new box is already assigned to another screen, unassign it first
     existing_screen_for_box = screen_service.get_screen_by_box_id(box_id)
     if existing_screen_for_box and existing_screen_for_box.get('screen_id') != screen_id:
         old_screen_id = existing_screen_for_box.get('screen_id')
-        print(f"[INFO] Box {box_id} is assigned to different screen {old_screen_id}, unassigning...")
+        logger.info(f"Box {box_id} is assigned to different screen {old_screen_id}, unassigning...")
         
         # Unassign the box from the old screen
         screen_service.unassign_box_from_screen(box_id)
@@ -402,177 +474,106 @@ def assign_user_to_screen():
         # Reset old screen port to default VLAN 101 on switch (mark as disconnected)
         old_screen_port = existing_screen_for_box.get('port_number')
         if old_screen_port:
-            try:
-                if cisco_worker.connection and cisco_worker.connection.is_open:
-                    default_screen_vlan = cisco_worker.default_screen_vlan
-                    print(f"[INFO] Resetting old screen port {old_screen_port} to VLAN {default_screen_vlan} (disconnected)")
-                    cisco_worker.assign_port_to_vlan(old_screen_port, default_screen_vlan)
-            except Exception as e:
-                print(f"[ERROR] Error resetting old screen port VLAN on switch: {e}")
+            default_screen_vlan = cisco_worker.default_screen_vlan
+            logger.info(f"Resetting old screen port {old_screen_port} to VLAN {default_screen_vlan} (disconnected)")
+            switch_updates.append((old_screen_port, default_screen_vlan))
         
         # Reset box port to default VLAN on switch
         box_port = box.get('port_number')
         if box_port:
-            try:
-                if cisco_worker.connection and cisco_worker.connection.is_open:
-                    default_vlan = box.get('vlan_number') or cisco_worker.default_box_vlan
-                    print(f"[INFO] Resetting box port {box_port} to VLAN {default_vlan}")
-                    cisco_worker.assign_port_to_vlan(box_port, default_vlan)
-            except Exception as e:
-                print(f"[ERROR] Error resetting box port VLAN on switch: {e}")
+            default_vlan = box.get('vlan_number') or cisco_worker.default_box_vlan
+            logger.info(f"Resetting box port {box_port} to VLAN {default_vlan}")
+            switch_updates.append((box_port, default_vlan))
     
     # Now assign box to screen (this will work since we've cleared any conflicts)
-    print(f"[INFO] Assigning box {box_id} to screen {screen_id} in database")
+    logger.info(f"Assigning box {box_id} to screen {screen_id} in database")
     screen = screen_service.assign_box_to_screen(box_id, screen_id)
     if not screen:
         # This should not happen after clearing conflicts, but handle it just in case
-        print(f"[ERROR] Failed to assign box {box_id} to screen {screen_id}")
-        return jsonify({'error': 'Failed to assign box to screen'}), 500
+        logger.error(f"Failed to assign box {box_id} to screen {screen_id}")
+        return error_response('Failed to assign box to screen', 500)
     
     # Physically assign screen port to box's VLAN on the switch
     screen_port = screen.get('port_number')
     box_vlan = box.get('vlan_number')
     
-    print(f"[INFO] Configuring switch: screen port {screen_port} to box VLAN {box_vlan}")
+    logger.info(f"Configuring switch: screen port {screen_port} to box VLAN {box_vlan}")
     if screen_port and box_vlan:
-        try:
-            if cisco_worker.connection and cisco_worker.connection.is_open:
-                success = cisco_worker.assign_port_to_vlan(screen_port, box_vlan)
-                if not success:
-                    print(f"[WARNING] Failed to assign screen port {screen_port} to box VLAN {box_vlan} on switch")
-                else:
-                    print(f"[SUCCESS] Screen port {screen_port} configured to VLAN {box_vlan}")
-        except Exception as e:
-            print(f"[ERROR] Error assigning screen port to box VLAN on switch: {e}")
+        switch_updates.append((screen_port, box_vlan))
     
-    print(f"[SUCCESS] User {user_id} assigned to screen {screen_id}")
+    # The conflict-clearing steps can touch the same port twice (e.g. reset
+    # then reassign); keep only the final VLAN per port before submitting
+    cisco_worker.submit_port_vlan_batch(list(dict(switch_updates).items()))
+
+    logger.info(f"User {user_id} assigned to screen {screen_id}")
     return jsonify(screen), 200
 
 
-@app.route('/screens/unassign_all', methods=['POST'])
 def unassign_all():
     """Unassign all boxes from all screens and remove all user assignments from boxes"""
-    try:
-        print("[INFO] Starting unassign_all operation...")
-        
-        # Get all screens that have assignments
-        screens = screen_service.get_all_screens()
-        assigned_screens = [s for s in screens if s.get('box_id') is not None]
-        
-        if not assigned_screens:
-            print("[INFO] No screen assignments found")
-            # Still check for user assignments in boxes
-            boxes = box_service.get_all_boxes()
-            assigned_boxes = [b for b in boxes if b.get('user_id') is not None]
-            if not assigned_boxes:
-                print("[INFO] No user assignments found")
-                return jsonify({'message': 'No assignments to remove'}), 200
-        
-        print(f"[INFO] Found {len(assigned_screens)} assigned screens")
-        
-        # Collect all box IDs from assigned screens for user unassignment
-        box_ids_to_unassign = set()
-        for screen in assigned_screens:
-            box_id = screen.get('box_id')
-            if box_id:
-                box_ids_to_unassign.add(box_id)
-        
-        success_count = 0
-        failed_screens = []
-        
-        for idx, screen in enumerate(assigned_screens, 1):
-            screen_id = screen.get('screen_id')
-            screen_port = screen.get('port_number')
-            box_id = screen.get('box_id')
-            print(f"[INFO] Processing screen {idx}/{len(assigned_screens)}: ID={screen_id}, Port={screen_port}, Box={box_id}")
-            
-            # Unassign in database
-            result = screen_service.unassign_screen(screen_id)
-            if result:
-                # Reset screen port to default VLAN 101 on switch
-                if screen_port:
-                    try:
-                        if cisco_worker.connection and cisco_worker.connection.is_open:
-                            default_screen_vlan = cisco_worker.default_screen_vlan
-                            success = cisco_worker.assign_port_to_vlan(screen_port, default_screen_vlan)
-                            if success:
-                                success_count += 1
-                                print(f"[SUCCESS] Screen {screen_id} port {screen_port} reset to VLAN {default_screen_vlan}")
-                            else:
-                                failed_screens.append(screen_port)
-                                print(f"[ERROR] Failed to reset screen {screen_id} port {screen_port}")
-                        else:
-                            # Database updated but switch not connected
-                            success_count += 1
-                            print(f"[WARNING] Screen {screen_id} unassigned in DB but switch not connected")
-                    except Exception as e:
-                        failed_screens.append(screen_port)
-                        print(f"[ERROR] Exception resetting screen {screen_id} port {screen_port}: {e}")
-                else:
-                    success_count += 1
-            else:
-                failed_screens.append(str(screen_id))
-                print(f"[ERROR] Failed to unassign screen {screen_id}")
-        
-        # Now unassign users from all boxes that were assigned to screens
-        users_unassigned = 0
-        for box_id in box_ids_to_unassign:
-            box = box_service.get_box_by_id(box_id)
-            if box and box.get('user_id'):
-                user_id = box.get('user_id')
-                print(f"[INFO] Unassigning user {user_id} from box {box_id}")
-                if box_service.unassign_user_from_box(user_id):
-                    users_unassigned += 1
-                    print(f"[SUCCESS] User {user_id} unassigned from box {box_id}")
+    logger.info("Starting unassign_all operation...")
+
+    # Clear every screen assignment in a single table update; the returned
+    # rows are the screens that were assigned, kept for the port resets below
+    freed_screens = screen_service.unassign_all_screens()
+
+    # Clear every user assignment in a single table update
+    users_unassigned = box_service.unassign_all_users()
+
+    if not freed_screens and not users_unassigned:
+        logger.info("No assignments to remove")
+        return jsonify({'message': 'No assignments to remove'}), 200
+
+    logger.info(f"Found {len(freed_screens)} assigned screens")
+
+    success_count = len(freed_screens)
+    failed_screens = []
+    ports_to_reset = [s.get('port_number') for s in freed_screens if s.get('port_number')]
+
+    # Reset all freed screen ports to the default VLAN in one CLI session
+    if ports_to_reset:
+        if cisco_worker.is_connected:
+            default_screen_vlan = cisco_worker.default_screen_vlan
+            try:
+                if cisco_worker.assign_ports_to_vlans(
+                        [(port, default_screen_vlan) for port in ports_to_reset]):
+                    logger.info(f"Reset {len(ports_to_reset)} screen ports to VLAN {default_screen_vlan}")
                 else:
-                    print(f"[ERROR] Failed to unassign user {user_id} from box {box_id}")
-        
-        # Also unassign users from any other boxes that might have users but no screen assignment
-        all_boxes = box_service.get_all_boxes()
-        for box in all_boxes:
-            if box.get('user_id') and box.get('box_id') not in box_ids_to_unassign:
-                user_id = box.get('user_id')
-                box_id = box.get('box_id')
-                print(f"[INFO] Unassigning user {user_id} from unassigned box {box_id}")
-                if box_service.unassign_user_from_box(user_id):
-                    users_unassigned += 1
-                    print(f"[SUCCESS] User {user_id} unassigned from box {box_id}")
-        
-        print(f"[INFO] Unassign all completed: {success_count} screens processed, {users_unassigned} users unassigned, {len(failed_screens)} failures")
-        
-        if failed_screens:
-            return jsonify({
-                'message': f'Removed {success_count} screen assignments and unassigned {users_unassigned} users',
-                'warning': f'Failed to reset ports: {', '.join(failed_screens)}'
-            }), 200
+                    failed_screens.extend(ports_to_reset)
+                    logger.error(f'Failed to reset screen ports: {", ".join(ports_to_reset)}')
+            except Exception as e:
+                failed_screens.extend(ports_to_reset)
+                logger.error(f"Exception resetting screen ports: {e}")
         else:
-            return jsonify({
-                'message': f'Successfully removed all {success_count} screen assignments and unassigned {users_unassigned} users'
-            }), 200
-    except Exception as e:
-        print(f"[ERROR] Exception in unassign_all: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': f'Failed to remove assignments: {str(e)}'}), 500
+            logger.warning(f"{len(ports_to_reset)} screens unassigned in DB but switch not connected")
+
+    logger.info(f"Unassign all completed: {success_count} screens processed, {users_unassigned} users unassigned, {len(failed_screens)} failures")
+
+    if failed_screens:
+        return jsonify({
+            'message': f'Removed {success_count} screen assignments and unassigned {users_unassigned} users',
+            'warning': f'Failed to reset ports: {", ".join(failed_screens)}'
+        }), 200
+    else:
+        return jsonify({
+            'message': f'Successfully removed all {success_count} screen assignments and unassigned {users_unassigned} users'
+        }), 200
 
 
-@app.route('/screens/disconnect', methods=['POST'])
 def disconnect_screen_endpoint():
     """Disconnect a screen (unassign it from any box) and unassign user from box"""
-    data = request.get_json()
+    data = get_body()
     
-    if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+    error = require_fields(data, 'screen_id')
+    if error:
+        return error_response(error, 400)
     
-    screen_id = data.get('screen_id')
-    
-    if screen_id is None:
-        return jsonify({'error': 'screen_id is required'}), 400
+    screen_id = data['screen_id']
     
     # Get screen to reset its port and find the associated box
     screen = screen_service.get_screen_by_id(screen_id)
     if not screen:
-        return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+        return error_response(ERROR_SCREEN_NOT_FOUND, 404)
     
     # Get the box_id that was assigned to this screen
     box_id = screen.get('box_id')
@@ -582,54 +583,45 @@ def disconnect_screen_endpoint():
         box = box_service.get_box_by_id(box_id)
         if box and box.get('user_id'):
             user_id = box.get('user_id')
-            print(f"[INFO] Unassigning user {user_id} from box {box_id}")
+            logger.info(f"Unassigning user {user_id} from box {box_id}")
             box_service.unassign_user_from_box(user_id)
     
     # Unassign screen from box
     result = screen_service.unassign_screen(screen_id)
     if result is None:
-        return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+        return error_response(ERROR_SCREEN_NOT_FOUND, 404)
     if result is False:
-        return jsonify({'error': ERROR_SCREEN_ALREADY_FREE}), 400
+        return error_response(ERROR_SCREEN_ALREADY_FREE, 400)
     
     # Reset SCREEN port to default VLAN 101 on switch
-    screen_port = screen.get('port_number')
-    if screen_port:
-        try:
-            if cisco_worker.connection and cisco_worker.connection.is_open:
-                default_screen_vlan = cisco_worker.default_screen_vlan
-                print(f"[INFO] Resetting screen port {screen_port} to default VLAN {default_screen_vlan}")
-                cisco_worker.assign_port_to_vlan(screen_port, default_screen_vlan)
-        except Exception as e:
-            print(f"[ERROR] Error resetting screen port VLAN on switch: {e}")
+    reset_screen_port(screen.get('port_number'))
     
     return jsonify({'message': 'Screen disconnected and user unassigned successfully'}), 200
 
 
-@app.route('/screens/unassign', methods=['POST'])
 def unassign_box_from_screen():
     """Unassign a box from a screen"""
-    data = request.get_json()
+    data = get_body()
     
     if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+        return error_response(ERROR_REQUEST_BODY_REQUIRED, 400)
     
     box_id = data.get('box_id')
     screen_id = data.get('screen_id')
     
     if box_id is None and screen_id is None:
-        return jsonify({'error': 'Either box_id or screen_id is required'}), 400
+        return error_response('Either box_id or screen_id is required', 400)
     
     if box_id is not None:
         # Get box before unassigning to get port info
         box = box_service.get_box_by_id(box_id)
         if not box:
-            return jsonify({'error': ERROR_BOX_NOT_FOUND}), 404
+            return error_response(ERROR_BOX_NOT_FOUND, 404)
         
         # Unassign user from box if one exists
         user_id = box.get('user_id')
         if user_id:
-            print(f"[INFO] Unassigning user {user_id} from box {box_id}")
+            logger.info(f"Unassigning user {user_id} from box {box_id}")
             box_service.unassign_user_from_box(user_id)
         
         # Get screen to reset its port
@@ -638,19 +630,11 @@ def unassign_box_from_screen():
         # Unassign by box_id
         unassigned = screen_service.unassign_box_from_screen(box_id)
         if not unassigned:
-            return jsonify({'error': 'Box has no assigned screen'}), 404
+            return error_response('Box has no assigned screen', 404)
         
         # Reset SCREEN port to default VLAN 101 on switch
         if screen:
-            screen_port = screen.get('port_number')
-            if screen_port:
-                try:
-                    if cisco_worker.connection and cisco_worker.connection.is_open:
-                        default_screen_vlan = cisco_worker.default_screen_vlan
-                        print(f"[INFO] Resetting screen port {screen_port} to default VLAN {default_screen_vlan}")
-                        cisco_worker.assign_port_to_vlan(screen_port, default_screen_vlan)
-                except Exception as e:
-                    print(f"[ERROR] Error resetting screen port VLAN on switch: {e}")
+            reset_screen_port(screen.get('port_number'))
         
         user_msg = f" and user {user_id}" if user_id else ""
         return jsonify({'message': f'Box unassigned from screen{user_msg} successfully'}), 200
@@ -659,7 +643,7 @@ def unassign_box_from_screen():
         # Get screen to reset its port
         screen = screen_service.get_screen_by_id(screen_id)
         if not screen:
-            return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+            return error_response(ERROR_SCREEN_NOT_FOUND, 404)
         
         box_id_from_screen = screen.get('box_id')
         
@@ -670,32 +654,23 @@ def unassign_box_from_screen():
             if box:
                 user_id = box.get('user_id')
                 if user_id:
-                    print(f"[INFO] Unassigning user {user_id} from box {box_id_from_screen}")
+                    logger.info(f"Unassigning user {user_id} from box {box_id_from_screen}")
                     box_service.unassign_user_from_box(user_id)
         
         # Unassign by screen_id
         result = screen_service.unassign_screen(screen_id)
         if result is None:
-            return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+            return error_response(ERROR_SCREEN_NOT_FOUND, 404)
         if result is False:
-            return jsonify({'error': ERROR_SCREEN_ALREADY_FREE}), 400
+            return error_response(ERROR_SCREEN_ALREADY_FREE, 400)
         
         # Reset SCREEN port to default VLAN 101 on switch
-        screen_port = screen.get('port_number')
-        if screen_port:
-            try:
-                if cisco_worker.connection and cisco_worker.connection.is_open:
-                    default_screen_vlan = cisco_worker.default_screen_vlan
-                    print(f"[INFO] Resetting screen port {screen_port} to default VLAN {default_screen_vlan}")
-                    cisco_worker.assign_port_to_vlan(screen_port, default_screen_vlan)
-            except Exception as e:
-                print(f"[ERROR] Error resetting screen port VLAN on switch: {e}")
+        reset_screen_port(screen.get('port_number'))
         
         user_msg = f" and user {user_id}" if user_id else ""
         return jsonify({'message': f'Screen unassigned{user_msg} successfully'}), 200
 
 
-@app.route('/screens/box/<int:box_id>', methods=['GET'])
 def get_screen_by_box(box_id):
     """Get screen assigned to a specific box"""
     screen = screen_service.get_screen_by_box_id(box_id)
@@ -709,21 +684,28 @@ def get_screen_by_box(box_id):
     }), 200
 
 
-@app.route('/screens/user/<user_id>', methods=['GET'])
+def get_user_view(user_id):
+    """Resolve a user to their box and that box's screen in one pass.
+
+    TinyDB has no joins, but both lookups are memoized by the services, so
+    repeat polls of the user endpoints cost no table scans.
+    """
+    box = box_service.get_box_by_user_id(user_id)
+    if not box:
+        return None, None
+    return box, screen_service.get_screen_by_box_id(box['box_id'])
+
+
 def get_user_screen(user_id):
     """Get screen assigned to a specific user (through their box)"""
-    # First get the user's box
-    box = box_service.get_box_by_user_id(user_id)
-    
+    box, screen = get_user_view(user_id)
+
     if not box:
         return jsonify({
             'has_box': False,
             'has_screen': False
         }), 200
-    
-    # Then get the screen for that box
-    screen = screen_service.get_screen_by_box_id(box['box_id'])
-    
+
     if not screen:
         return jsonify({
             'has_box': True,
@@ -748,13 +730,12 @@ def get_user_screen(user_id):
     }), 200
 
 
-@app.route('/screens/<int:screen_id>', methods=['PUT', 'PATCH'])
 def update_screen(screen_id):
     """Update screen attributes"""
-    data = request.get_json()
+    data = get_body()
     
     if not data:
-        return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
+        return error_response(ERROR_REQUEST_BODY_REQUIRED, 400)
     
     # Extract updatable fields
     screen_number = data.get('screen_number')
@@ -763,293 +744,289 @@ def update_screen(screen_id):
     
     # Check if at least one field is provided
     if screen_number is None and port_number is None and vlan_number is None:
-        return jsonify({'error': 'At least one field (screen_number, port_number, or vlan_number) must be provided'}), 400
+        return error_response('At least one field (screen_number, port_number, or vlan_number) must be provided', 400)
     
     # Update the screen
     updated_screen = screen_service.update_screen(screen_id, screen_number=screen_number, port_number=port_number, vlan_number=vlan_number)
     
     if not updated_screen:
-        return jsonify({'error': ERROR_SCREEN_NOT_FOUND}), 404
+        return error_response(ERROR_SCREEN_NOT_FOUND, 404)
     
     return jsonify(updated_screen), 200
 
 
 # Cisco switch endpoints
 
-@app.route('/switch/info', methods=['GET'])
 def get_switch_info():
     """Get comprehensive switch information"""
-    try:
-        info = cisco_worker.get_switch_info()
-        return jsonify(info), 200
-    except Exception as e:
-        return jsonify({'error': f'Failed to get switch info: {str(e)}'}), 500
+    info = get_switch_cached('info', cisco_worker.get_switch_info)
+    return jsonify(info), 200
 
 
-@app.route('/switch/ports', methods=['GET'])
 def get_all_ports():
     """Get status of all ports on the switch"""
-    try:
-        ports = cisco_worker.get_all_ports_status()
-        return jsonify(ports), 200
-    except Exception as e:
-        return jsonify({'error': f'Failed to get ports status: {str(e)}'}), 500
+    ports = get_switch_cached('ports', cisco_worker.get_all_ports_status)
+    return stream_json_list(ports)
 
 
-@app.route('/switch/ports_vlans', methods=['GET'])
 def get_all_ports_vlans():
     """Get VLAN configuration for all ports from the switch"""
-    try:
-        print("[INFO] Getting VLANs for all ports from switch...")
-        if not cisco_worker.connection or not cisco_worker.connection.is_open:
-            print("[ERROR] Switch not connected")
-            return jsonify({'error': 'Switch not connected'}), 500
-        
-        # Get all boxes and screens
-        boxes = box_service.get_all_boxes()
-        screens = screen_service.get_all_screens()
-        
-        result = {
-            'boxes': {},
-            'screens': {}
-        }
-        
-        # Get actual VLANs for boxes
+    logger.info("Getting VLANs for all ports from switch...")
+    if not cisco_worker.is_connected:
+        logger.error("Switch not connected")
+        return error_response('Switch not connected', 500)
+
+    # Get all boxes and screens that actually map to a switch port
+    boxes = box_service.get_all_boxes_with_port()
+    screens = screen_service.get_all_screens_with_port()
+
+    # One CLI round-trip for every port, then index in memory
+    vlans = get_switch_cached('port_vlans', cisco_worker.get_all_port_vlans)
+
+    logger.info(f"Streaming VLANs for {len(boxes)} boxes and {len(screens)} screens")
+
+    # Stream each id/vlan pair as it is indexed instead of materializing the
+    # full result dict and its serialized body
+    def generate():
+        yield b'{"boxes":{'
+        first = True
         for box in boxes:
-            port = box.get('port_number')
-            box_id = box.get('box_id')
-            if port:
-                print(f"[DEBUG] Getting VLAN for box {box_id} port {port}")
-                vlan = cisco_worker.get_port_vlan(port)
-                result['boxes'][box_id] = vlan
-                print(f"[DEBUG] Box {box_id} port {port} VLAN: {vlan}")
-        
-        # Get actual VLANs for screens
+            if not first:
+                yield b','
+            first = False
+            yield orjson.dumps(str(box.get('box_id'))) + b':' + orjson.dumps(vlans.get(box['port_number']))
+        yield b'},"screens":{'
+        first = True
         for screen in screens:
-            port = screen.get('port_number')
-            screen_id = screen.get('screen_id')
-            if port:
-                print(f"[DEBUG] Getting VLAN for screen {screen_id} port {port}")
-                vlan = cisco_worker.get_port_vlan(port)
-                result['screens'][screen_id] = vlan
-                print(f"[DEBUG] Screen {screen_id} port {port} VLAN: {vlan}")
-        
-        print(f"[SUCCESS] Retrieved VLANs for {len(result['boxes'])} boxes and {len(result['screens'])} screens")
-        return jsonify(result), 200
-    except Exception as e:
-        print(f"[ERROR] Failed to get ports VLANs: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': f'Failed to get ports VLANs: {str(e)}'}), 500
+            if not first:
+                yield b','
+            first = False
+            yield orjson.dumps(str(screen.get('screen_id'))) + b':' + orjson.dumps(vlans.get(screen['port_number']))
+        yield b'}}'
+
+    return app.response_class(generate(), mimetype='application/json')
 
 
-@app.route('/switch/reconfigure_port', methods=['POST'])
 def reconfigure_port():
     """Reconfigure a specific port to a target VLAN"""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': ERROR_REQUEST_BODY_REQUIRED}), 400
-        
-        port = data.get('port')
-        vlan = data.get('vlan')
-        
-        if not port or not vlan:
-            return jsonify({'error': 'Both port and vlan are required'}), 400
-        
-        print(f"[INFO] Reconfiguring port {port} to VLAN {vlan}")
-        
-        if not cisco_worker.connection or not cisco_worker.connection.is_open:
-            print("[ERROR] Switch not connected")
-            return jsonify({'error': 'Switch not connected'}), 500
-        
-        success = cisco_worker.assign_port_to_vlan(port, vlan)
-        
-        if success:
-            print(f"[SUCCESS] Port {port} reconfigured to VLAN {vlan}")
-            return jsonify({'message': f'Port {port} successfully reconfigured to VLAN {vlan}'}), 200
-        else:
-            print(f"[ERROR] Failed to reconfigure port {port} to VLAN {vlan}")
-            return jsonify({'error': f'Failed to reconfigure port {port}'}), 500
-    except Exception as e:
-        print(f"[ERROR] Exception in reconfigure_port: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': f'Failed to reconfigure port: {str(e)}'}), 500
+    data = get_body()
+
+    error = require_fields(data, 'port', 'vlan')
+    if error:
+        return error_response(error, 400)
+
+    port = data['port']
+    vlan = data['vlan']
+
+    logger.info(f"Reconfiguring port {port} to VLAN {vlan}")
+
+    if not cisco_worker.is_connected:
+        logger.error("Switch not connected")
+        return error_response('Switch not connected', 500)
+
+    success = cisco_worker.assign_port_to_vlan(port, vlan)
+
+    if success:
+        invalidate_switch_cache()
+        logger.info(f"Port {port} reconfigured to VLAN {vlan}")
+        return jsonify({'message': f'Port {port} successfully reconfigured to VLAN {vlan}'}), 200
+    else:
+        logger.error(f"Failed to reconfigure port {port} to VLAN {vlan}")
+        return jsonify({'error': f'Failed to reconfigure port {port}'}), 500
 
 
-@app.route('/switch/ports/<path:port>', methods=['GET'])
 def get_port_status(port):
     """Get status of a specific port"""
-    try:
-        status = cisco_worker.get_port_status(port)
-        return jsonify(status), 200
-    except Exception as e:
-        return jsonify({'error': f'Failed to get port status: {str(e)}'}), 500
+    status = cisco_worker.get_port_status(port)
+    return jsonify(status), 200
 
 
-@app.route('/switch/sync', methods=['POST'])
 def sync_switch():
     """Manually trigger switch synchronization with database"""
-    try:
-        success = cisco_worker.sync_with_db()
-        if success:
-            return jsonify({'message': 'Switch synchronized successfully'}), 200
-        else:
-            return jsonify({'error': 'Failed to synchronize switch'}), 500
-    except Exception as e:
-        return jsonify({'error': f'Failed to sync switch: {str(e)}'}), 500
+    success = cisco_worker.sync_with_db()
+    if success:
+        invalidate_switch_cache()
+        return jsonify({'message': 'Switch synchronized successfully'}), 200
+    else:
+        return error_response('Failed to synchronize switch', 500)
 
 
-@app.route('/screens/reset_all_vlans', methods=['POST'])
 def reset_all_screen_vlans():
     """Reset all screen ports to default VLAN 101"""
-    try:
-        print("[INFO] Starting reset_all_screen_vlans operation...")
-        
-        if not cisco_worker.connection or not cisco_worker.connection.is_open:
-            print("[ERROR] Switch not connected")
-            return jsonify({'error': 'Switch not connected'}), 500
-        
-        # Get all screens
-        screens = screen_service.get_all_screens()
-        if not screens:
-            print("[INFO] No screens found")
-            return jsonify({'message': 'No screens found'}), 200
-        
-        print(f"[INFO] Found {len(screens)} screens to reset")
-        default_vlan = cisco_worker.default_screen_vlan
-        print(f"[INFO] Default screen VLAN: {default_vlan}")
-        
-        success_count = 0
-        failed_ports = []
-        
-        for idx, screen in enumerate(screens, 1):
-            screen_port = screen.get('port_number')
-            screen_id = screen.get('screen_id')
-            if screen_port:
-                print(f"[INFO] Processing screen {idx}/{len(screens)}: ID={screen_id}, Port={screen_port}")
-                success = cisco_worker.assign_port_to_vlan(screen_port, default_vlan)
-                if success:
-                    success_count += 1
-                    print(f"[SUCCESS] Screen {screen_id} port {screen_port} reset successfully ({success_count}/{len(screens)})")
-                else:
-                    failed_ports.append(screen_port)
-                    print(f"[ERROR] Failed to reset screen {screen_id} port {screen_port}")
-            else:
-                print(f"[WARNING] Screen {screen_id} has no port number")
-        
-        print(f"[INFO] Reset operation completed: {success_count} successful, {len(failed_ports)} failed")
-        
-        if failed_ports:
-            return jsonify({
-                'message': f'Reset {success_count} screens to VLAN {default_vlan}',
-                'warning': f'Failed to reset ports: {", ".join(failed_ports)}'
-            }), 200
+    logger.info("Starting reset_all_screen_vlans operation...")
+
+    if not cisco_worker.is_connected:
+        logger.error("Switch not connected")
+        return error_response('Switch not connected', 500)
+
+    # Get all screens that actually map to a switch port
+    screens = screen_service.get_all_screens_with_port()
+    if not screens:
+        logger.info("No screens found")
+        return jsonify({'message': 'No screens found'}), 200
+
+    logger.info(f"Found {len(screens)} screens to reset")
+    default_vlan = cisco_worker.default_screen_vlan
+    logger.info(f"Default screen VLAN: {default_vlan}")
+
+    ports = [screen['port_number'] for screen in screens]
+
+    # Reset every screen port in one config session instead of one
+    # enable/config/interface round-trip per screen
+    success_count = 0
+    failed_ports = []
+    if ports:
+        if cisco_worker.assign_ports_to_vlans([(port, default_vlan) for port in ports]):
+            success_count = len(ports)
         else:
-            return jsonify({
-                'message': f'Successfully reset all {success_count} screens to VLAN {default_vlan}'
-            }), 200
-    except Exception as e:
-        print(f"[ERROR] Exception in reset_all_screen_vlans: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': f'Failed to reset screen VLANs: {str(e)}'}), 500
+            failed_ports = ports
+
+    logger.info(f"Reset operation completed: {success_count} successful, {len(failed_ports)} failed")
+
+    if failed_ports:
+        return jsonify({
+            'message': f'Reset {success_count} screens to VLAN {default_vlan}',
+            'warning': f'Failed to reset ports: {", ".join(failed_ports)}'
+        }), 200
+    else:
+        return jsonify({
+            'message': f'Successfully reset all {success_count} screens to VLAN {default_vlan}'
+        }), 200
 
 
-@app.route('/switch/connect', methods=['POST'])
 def connect_switch():
     """Connect to the switch"""
-    try:
-        success = cisco_worker.connect()
-        if success:
-            return jsonify({'message': 'Connected to switch successfully'}), 200
-        else:
-            return jsonify({'error': 'Failed to connect to switch'}), 500
-    except Exception as e:
-        return jsonify({'error': f'Failed to connect: {str(e)}'}), 500
+    success = cisco_worker.connect()
+    if success:
+        invalidate_switch_cache()
+        return jsonify({'message': 'Connected to switch successfully'}), 200
+    else:
+        return error_response('Failed to connect to switch', 500)
 
 
-@app.route('/switch/disconnect', methods=['POST'])
 def disconnect_switch():
     """Disconnect from the switch"""
-    try:
-        cisco_worker.disconnect()
-        return jsonify({'message': 'Disconnected from switch successfully'}), 200
-    except Exception as e:
-        return jsonify({'error': f'Failed to disconnect: {str(e)}'}), 500
+    cisco_worker.disconnect()
+    invalidate_switch_cache()
+    return jsonify({'message': 'Disconnected from switch successfully'}), 200
 
 
-@app.route('/config/serial_port', methods=['GET'])
 def get_serial_port():
     """Get the configured serial port"""
-    try:
-        serial_port = config_service.get_serial_port()
-        return jsonify({'serial_port': serial_port}), 200
-    except Exception as e:
-        return jsonify({'error': f'Failed to get serial port: {str(e)}'}), 500
+    serial_port = config_service.get_serial_port()
+    return jsonify({'serial_port': serial_port}), 200
 
 
-@app.route('/config/serial_port', methods=['PUT', 'POST'])
 def set_serial_port():
     """Set the serial port configuration"""
-    try:
-        data = request.get_json()
-        if not data or 'serial_port' not in data:
-            return jsonify({'error': 'serial_port is required'}), 400
-        
-        serial_port = data['serial_port']
-        
-        # Update configuration in database
-        config_service.set_serial_port(serial_port)
-        
-        # Disconnect current connection if exists
-        if cisco_worker.connection and cisco_worker.connection.is_open:
+    data = get_body()
+    error = require_fields(data, 'serial_port')
+    if error:
+        return error_response(error, 400)
+
+    serial_port = data['serial_port']
+
+    # Update configuration in database
+    config_service.set_serial_port(serial_port)
+
+    # Tearing down the old serial connection can block on the OS close;
+    # hand it to a background thread so the response returns after the
+    # DB write. disconnect() takes the worker's serial lock, so the
+    # teardown waits for any in-flight command rather than racing it
+    def switch_port():
+        if cisco_worker.is_connected:
             cisco_worker.disconnect()
-        
-        # Update worker with new port
         cisco_worker.serial_port = serial_port
-        
-        return jsonify({
-            'message': 'Serial port updated successfully',
-            'serial_port': serial_port
-        }), 200
-    except Exception as e:
-        return jsonify({'error': f'Failed to set serial port: {str(e)}'}), 500
+
+    threading.Thread(target=switch_port, daemon=True).start()
+
+    return jsonify({
+        'message': 'Serial port updated successfully',
+        'serial_port': serial_port
+    }), 200
 
 
-@app.route('/config', methods=['GET'])
 def get_all_config():
     """Get all configuration values"""
-    try:
-        config = config_service.get_all_config()
-        return jsonify(config), 200
-    except Exception as e:
-        return jsonify({'error': f'Failed to get configuration: {str(e)}'}), 500
+    config = config_service.get_all_config()
+    return jsonify(config), 200
+
+
+# URL rules registered from a single table instead of per-handler decorators.
+# The handler function name doubles as the endpoint name.
+ROUTES = [
+    ('/boxes', add_box, ['POST']),
+    ('/boxes/<int:box_id>', delete_box, ['DELETE']),
+    ('/boxes/assign', assign_box, ['POST']),
+    ('/boxes/assign_user_to_free_box', assign_user_to_free_box, ['POST']),
+    ('/boxes/unassign', unassign_box, ['POST']),
+    ('/boxes/free', get_free_boxes, ['GET']),
+    ('/boxes', get_all_boxes, ['GET']),
+    ('/boxes/user/<user_id>', get_user_box, ['GET']),
+    ('/boxes/<int:box_id>', update_box, ['PUT', 'PATCH']),
+    ('/screens', add_screen, ['POST']),
+    ('/screens/<int:screen_id>', delete_screen, ['DELETE']),
+    ('/screens', get_all_screens, ['GET']),
+    ('/screens/free', get_free_screens, ['GET']),
+    ('/screens/<int:screen_id>', get_screen, ['GET']),
+    ('/screens/assign', assign_box_to_screen, ['POST']),
+    ('/screens/assign_user', assign_user_to_screen, ['POST']),
+    ('/screens/unassign_all', unassign_all, ['POST']),
+    ('/screens/disconnect', disconnect_screen_endpoint, ['POST']),
+    ('/screens/unassign', unassign_box_from_screen, ['POST']),
+    ('/screens/box/<int:box_id>', get_screen_by_box, ['GET']),
+    ('/screens/user/<user_id>', get_user_screen, ['GET']),
+    ('/screens/<int:screen_id>', update_screen, ['PUT', 'PATCH']),
+    ('/switch/info', get_switch_info, ['GET']),
+    ('/switch/ports', get_all_ports, ['GET']),
+    ('/switch/ports_vlans', get_all_ports_vlans, ['GET']),
+    ('/switch/reconfigure_port', reconfigure_port, ['POST']),
+    ('/switch/ports/<path:port>', get_port_status, ['GET']),
+    ('/switch/sync', sync_switch, ['POST']),
+    ('/screens/reset_all_vlans', reset_all_screen_vlans, ['POST']),
+    ('/switch/connect', connect_switch, ['POST']),
+    ('/switch/disconnect', disconnect_switch, ['POST']),
+    ('/config/serial_port', get_serial_port, ['GET']),
+    ('/config/serial_port', set_serial_port, ['PUT', 'POST']),
+    ('/config', get_all_config, ['GET']),
+]
+
+# strict_slashes=False matches '/boxes' and '/boxes/' with the same rule, so
+# trailing-slash requests dispatch directly instead of via a 308 redirect
+for _rule, _view, _methods in ROUTES:
+    app.add_url_rule(_rule, _view.__name__, _view, methods=_methods, strict_slashes=False)
+
+# The route table is complete and static, so compile the URL matcher now
+# (a throwaway bind+match) rather than lazily on the first request
+app.url_map.bind('localhost').match('/boxes', method='GET')
 
 
 def initialize_switch():
     """Initialize switch connection and sync with DB on server startup"""
     try:
-        print("Connecting to Cisco switch...")
+        # Background worker that applies queued VLAN assignments
+        cisco_worker.start_worker()
+        logger.info("Connecting to Cisco switch...")
         if cisco_worker.connect():
-            print("Connected to switch, entering enable mode...")
+            logger.info("Connected to switch, entering enable mode...")
             if cisco_worker.enable_mode():
-                print("Synchronizing switch with database...")
+                logger.info("Synchronizing switch with database...")
                 if cisco_worker.sync_with_db():
-                    print("Switch synchronized successfully")
+                    logger.info("Switch synchronized successfully")
                 else:
-                    print("Warning: Failed to synchronize switch with database")
+                    logger.warning("Failed to synchronize switch with database")
             else:
-                print("Warning: Failed to enter enable mode")
+                logger.warning("Failed to enter enable mode")
         else:
-            print("Warning: Failed to connect to switch. Switch operations will be unavailable.")
+            logger.warning("Failed to connect to switch. Switch operations will be unavailable.")
     except Exception as e:
-        print(f"Error initializing switch: {e}")
+        logger.error(f"Error initializing switch: {e}")
 
 
 if __name__ == '__main__':
-    # Initialize switch on startup
-    initialize_switch()
-    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
+    # Initialize the switch in the background so the server starts serving
+    # requests immediately instead of blocking on serial connect/sync
+    threading.Thread(target=initialize_switch, name='switch-init', daemon=True).start()
+    # threaded=True lets requests overlap while one is blocked on switch I/O
+    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False, threaded=True)
 
@@ -0,0 +1,13 @@
+"""Gunicorn configuration for wsgi:application.
+
+The app must run as a single process: the switch serial port can only be
+held by one process, and the service-layer caches plus the TinyDB file
+are not safe to share across forks. Concurrency comes from threads
+instead — request handlers are DB-bound, and switch CLI work already
+runs on the background worker queue.
+"""
+bind = '0.0.0.0:5000'
+workers = 1
+threads = 16
+worker_class = 'gthread'
+timeout = 60
@@ -1,24 +1,60 @@
-from tinydb import TinyDB, Query
+import threading
+
+from tinydb import Query
+
+from services.db import get_db, get_db_lock
 from typing import Optional, List, Dict
 
 
 class BoxService:
     """Service layer for box management database operations"""
-    
+
+    __slots__ = ('db', 'boxes_table', 'box_query', '_q_free', '_q_assigned', '_q_with_port',
+                 '_box_cache', '_user_cache', '_list_cache',
+                 '_box_index', '_user_index', '_next_id', '_id_lock', '_lock')
+
     def __init__(self, db_path: str = 'boxes.json'):
         """Initialize the service with database connection"""
-        self.db = TinyDB(db_path)
+        self.db = get_db(db_path)
+        # TinyDB is not thread-safe; every table access and cache rebuild
+        # runs under the per-file lock shared with the other services
+        self._lock = get_db_lock(db_path)
         self.boxes_table = self.db.table('boxes')
         self.box_query = Query()
-    
+        # Precompiled query conditions, built once instead of per call
+        self._q_free = (self.box_query.user_id == None)
+        self._q_assigned = (self.box_query.user_id != None)
+        self._q_with_port = (self.box_query.port_number.exists()
+                             & (self.box_query.port_number != None)
+                             & (self.box_query.port_number != ''))
+        # In-memory read caches, invalidated on every mutation
+        self._box_cache: Dict[int, Dict] = {}
+        self._user_cache: Dict[str, Dict] = {}
+        self._list_cache: Dict[str, List[Dict]] = {}
+        # box_id/user_id -> doc_id indexes, rebuilt lazily after a mutation
+        self._box_index: Optional[Dict[int, int]] = None
+        self._user_index: Optional[Dict[str, int]] = None
+        # Next box ID, computed once instead of a max() scan per insert.
+        # Monotonic: deleting a box never frees its ID for reuse
+        with self._lock:
+            self._next_id = 1 + max((box.get('box_id', 0) for box in self.boxes_table.all()), default=0)
+        self._id_lock = threading.Lock()
+
+    def _invalidate_cache(self) -> None:
+        """Drop all cached lookups after a mutation (caller holds _lock)"""
+        self._box_cache.clear()
+        self._user_cache.clear()
+        self._list_cache.clear()
+        self._box_index = None
+        self._user_index = None
+
     def _get_next_box_id(self) -> int:
-        """Generate the next box ID by finding the maximum existing ID + 1"""
-        all_boxes = self.boxes_table.all()
-        if not all_boxes:
-            return 1
-        max_id = max(box.get('box_id', 0) for box in all_boxes)
-        return max_id + 1
-    
+        """Reserve and return the next box ID"""
+        with self._id_lock:
+            next_id = self._next_id
+            self._next_id += 1
+            return next_id
+
     def create_box(self, port_number: str, box_number: str, vlan_number: Optional[str] = None) -> Dict:
         """Create a new box and return it"""
         box_id = self._get_next_box_id()
@@ -29,90 +65,150 @@ class BoxService:
             'vlan_number': vlan_number,
             'user_id': None
         }
-        self.boxes_table.insert(new_box)
+        with self._lock:
+            self.boxes_table.insert(new_box)
+            self._invalidate_cache()
         return new_box
-    
+
     def delete_box(self, box_id: int) -> bool:
         """Delete a box by ID. Returns True if deleted, False if not found"""
-        result = self.boxes_table.remove(self.box_query.box_id == box_id)
+        with self._lock:
+            result = self.boxes_table.remove(self.box_query.box_id == box_id)
+            self._invalidate_cache()
         return len(result) > 0
-    
+
+    def _ensure_indexes(self) -> None:
+        """Rebuild the box_id/user_id -> doc_id indexes in one table pass (caller holds _lock)"""
+        if self._box_index is None:
+            box_index: Dict[int, int] = {}
+            user_index: Dict[str, int] = {}
+            for box in self.boxes_table.all():
+                box_index[box.get('box_id')] = box.doc_id
+                if box.get('user_id') is not None:
+                    user_index[box['user_id']] = box.doc_id
+            self._box_index = box_index
+            self._user_index = user_index
+
     def get_box_by_id(self, box_id: int) -> Optional[Dict]:
         """Get a box by its ID. Returns None if not found"""
-        result = self.boxes_table.search(self.box_query['box_id'] == box_id)
-        return result[0] if result else None
-    
+        with self._lock:
+            if box_id in self._box_cache:
+                return self._box_cache[box_id]
+            self._ensure_indexes()
+            doc_id = self._box_index.get(box_id)
+            if doc_id is None:
+                return None
+            box = self.boxes_table.get(doc_id=doc_id)
+            if box is not None:
+                self._box_cache[box_id] = box
+            return box
+
     def get_box_by_user_id(self, user_id: str) -> Optional[Dict]:
         """Get a box assigned to a specific user. Returns None if not found"""
-        result = self.boxes_table.search(self.box_query['user_id'] == user_id)
-        return result[0] if result else None
-    
+        with self._lock:
+            if user_id in self._user_cache:
+                return self._user_cache[user_id]
+            self._ensure_indexes()
+            doc_id = self._user_index.get(user_id)
+            if doc_id is None:
+                return None
+            box = self.boxes_table.get(doc_id=doc_id)
+            if box is not None:
+                self._user_cache[user_id] = box
+            return box
+
     def get_all_boxes(self) -> List[Dict]:
         """Get all boxes"""
-        return self.boxes_table.all()
-    
+        with self._lock:
+            if 'all' not in self._list_cache:
+                self._list_cache['all'] = self.boxes_table.all()
+            return self._list_cache['all']
+
+    def get_all_boxes_with_port(self) -> List[Dict]:
+        """Get all boxes that have a port_number set"""
+        with self._lock:
+            if 'with_port' not in self._list_cache:
+                self._list_cache['with_port'] = self.boxes_table.search(self._q_with_port)
+            return self._list_cache['with_port']
+
     def get_free_boxes(self) -> List[Dict]:
         """Get all free boxes (boxes with user_id = None)"""
-        return self.boxes_table.search(self.box_query.user_id == None)
-    
+        with self._lock:
+            if 'free' not in self._list_cache:
+                self._list_cache['free'] = self.boxes_table.search(self._q_free)
+            return self._list_cache['free']
+
     def assign_user_to_box(self, user_id: str, box_id: int) -> Optional[Dict]:
         """Assign a user to a specific box. Returns the updated box or None if not found"""
-        box = self.get_box_by_id(box_id)
-        if not box:
-            return None
-        
-        # Check if box is already assigned
-        if box['user_id'] is not None:
-            return None  # Indicates box is already assigned
-        
-        # Assign user to box
-        self.boxes_table.update({'user_id': str(user_id)}, self.box_query["box_id"] == box_id)
-        box['user_id'] = user_id
-        return box
-    
+        with self._lock:
+            box = self.get_box_by_id(box_id)
+            if not box:
+                return None
+
+            # Check if box is already assigned
+            if box['user_id'] is not None:
+                return None  # Indicates box is already assigned
+
+            # Assign user to box
+            self.boxes_table.update({'user_id': str(user_id)}, self.box_query["box_id"] == box_id)
+            self._invalidate_cache()
+            box['user_id'] = user_id
+            return box
+
     def assign_user_to_any_free_box(self, user_id: str) -> Optional[Dict]:
         """Assign a user to any free box. Returns the assigned box or None if no free boxes"""
-        free_boxes = self.get_free_boxes()
-        if not free_boxes:
-            return None
-        
-        # Assign to the first free box
-        box = free_boxes[0]
-        self.boxes_table.update({'user_id': user_id}, self.box_query.box_id == box['box_id'])
-        box['user_id'] = user_id
-        return box
-    
+        with self._lock:
+            free_boxes = self.get_free_boxes()
+            if not free_boxes:
+                return None
+
+            # Assign to the first free box
+            box = free_boxes[0]
+            self.boxes_table.update({'user_id': user_id}, self.box_query.box_id == box['box_id'])
+            self._invalidate_cache()
+            box['user_id'] = user_id
+            return box
+
     def unassign_user_from_box(self, user_id: str) -> bool:
         """Unassign a user from their box. Returns True if unassigned, False if user has no box"""
-        result = self.boxes_table.search(self.box_query.user_id == user_id)
-        if not result:
-            return False
-        
-        self.boxes_table.update({'user_id': None}, self.box_query.user_id == user_id)
-        return True
-    
+        with self._lock:
+            # The update's affected doc_ids double as the existence check
+            updated = self.boxes_table.update({'user_id': None}, self.box_query.user_id == user_id)
+            if not updated:
+                return False
+            self._invalidate_cache()
+            return True
+
     def unassign_box(self, box_id: int) -> Optional[bool]:
         """Unassign a box by box_id. Returns True if unassigned, False if already free, None if not found"""
-        box = self.get_box_by_id(box_id)
-        if not box:
-            return None
-        
-        if box['user_id'] is None:
-            return False  # Already free
-        
-        self.boxes_table.update({'user_id': None}, self.box_query.box_id == box_id)
-        return True
-    
+        with self._lock:
+            box = self.get_box_by_id(box_id)
+            if not box:
+                return None
+
+            if box['user_id'] is None:
+                return False  # Already free
+
+            self.boxes_table.update({'user_id': None}, self.box_query.box_id == box_id)
+            self._invalidate_cache()
+            return True
+
     def unassign_user_if_exists(self, user_id: str) -> None:
         """Unassign a user from their box if they have one. Does nothing if user has no box"""
-        self.boxes_table.update({'user_id': None}, self.box_query.user_id == user_id)
-    
+        with self._lock:
+            self.boxes_table.update({'user_id': None}, self.box_query.user_id == user_id)
+            self._invalidate_cache()
+
+    def unassign_all_users(self) -> int:
+        """Remove the user from every assigned box in one update. Returns the number of boxes freed"""
+        with self._lock:
+            updated = self.boxes_table.update({'user_id': None}, self._q_assigned)
+            if updated:
+                self._invalidate_cache()
+            return len(updated)
+
     def update_box(self, box_id: int, box_number: Optional[str] = None, port_number: Optional[str] = None, vlan_number: Optional[str] = None) -> Optional[Dict]:
         """Update box attributes. Returns the updated box or None if not found"""
-        box = self.get_box_by_id(box_id)
-        if not box:
-            return None
-        
         update_data = {}
         if box_number is not None:
             update_data['box_number'] = box_number
@@ -120,13 +216,19 @@ class BoxService:
             update_data['port_number'] = port_number
         if vlan_number is not None:
             update_data['vlan_number'] = vlan_number
-        
-        if not update_data:
-            return box  # No updates to make, return existing box
-        
-        self.boxes_table.update(update_data, self.box_query['box_id'] == box_id)
-        
-        # Return updated box
-        updated_box = self.get_box_by_id(box_id)
-        return updated_box
 
+        with self._lock:
+            box = self.get_box_by_id(box_id)
+            if not box:
+                return None
+
+            if not update_data:
+                return box  # No updates to make, return existing box
+
+            self.boxes_table.update(update_data, self.box_query['box_id'] == box_id)
+            self._invalidate_cache()
+
+            # The stored row now matches the fetched dict plus the update; merge
+            # locally instead of re-reading the table
+            box.update(update_data)
+            return box
@@ -1,4 +1,7 @@
 import serial
+import logging
+import threading
+import queue
 import time
 import re
 from typing import Optional, List, Dict, Tuple
@@ -9,12 +12,38 @@ from services.cisco_worker.cisco_worker_constants import VIEWER_PORT, VIEWER_VLA
 # Constants
 CONFIG_INDICATOR = "(config)"
 
+# Output parsers, compiled once at import instead of per call
+ACCESS_VLAN_RE = re.compile(r'Access Mode VLAN:\s*(\d+)', re.IGNORECASE)
+VLAN_RE = re.compile(r'VLAN\s+(\d+)', re.IGNORECASE)
+
+# Status column tokens in 'show interfaces status' output; the Vlan column
+# immediately follows whichever of these appears
+STATUS_TOKENS = ('connected', 'notconnect', 'disabled', 'err-disabled', 'inactive')
+
+# Row parsers for tabular output, applied to the whole response in one
+# finditer pass instead of a Python loop over split lines. The Name column
+# may be blank, so the row pattern anchors on the status token
+STATUS_ROW_RE = re.compile(
+    r'^(?P<port>(?:Gi|Fa|Te)\S+)\s+.*?(?P<status>' + '|'.join(STATUS_TOKENS) + r')\s+(?P<vlan>\S+)',
+    re.MULTILINE | re.IGNORECASE)
+VLAN_BRIEF_ROW_RE = re.compile(r'^\s*(?P<id>\d+)\s+(?P<name>\S+)', re.MULTILINE)
+
+logger = logging.getLogger(__name__)
+
 
 class CiscoWorker:
     """Worker for managing Cisco 9300 switch via serial connection"""
-    
+
+    # A single serial console can only run one CLI exchange at a time, so
+    # multi-port operations must batch through assign_ports_to_vlans rather
+    # than fan out. A transport with per-call sessions (e.g. SSH) could
+    # flip this to allow concurrent switch calls.
+    supports_concurrent = False
+
     def __init__(self, serial_port: str = "COM4", baudrate: int = 9600, 
-                 timeout: float = 2.0, db_path: str = 'boxes.json'):
+                 timeout: float = 2.0, db_path: str = 'boxes.json',
+                 box_service: Optional[BoxService] = None,
+                 screen_service: Optional[ScreenService] = None):
         """
         Initialize Cisco worker
         
@@ -23,16 +52,99 @@ class CiscoWorker:
             baudrate: Serial communication baudrate
             timeout: Serial read timeout in seconds
             db_path: Path to the database file
+            box_service: Shared BoxService; a new one is created if omitted
+            screen_service: Shared ScreenService; a new one is created if omitted
         """
         self.serial_port = serial_port
         self.baudrate = baudrate
         self.timeout = timeout
         self.connection = None
-        self.box_service = BoxService(db_path)
-        self.screen_service = ScreenService(db_path)
+        # Reusing the caller's services keeps their in-memory caches
+        # coherent with the mutations this worker observes
+        self.box_service = box_service or BoxService(db_path)
+        self.screen_service = screen_service or ScreenService(db_path)
         self.default_box_vlan = DEFAULT_BOX_VLAN
         self.default_screen_vlan = DEFAULT_SCREEN_VLAN
-        
+        # Serialize access to the switch CLI between the request threads and
+        # the background worker; reentrant so nested commands stay atomic
+        self._serial_lock = threading.RLock()
+        self._vlan_queue = queue.Queue()
+        # Startup guard for the worker thread; separate from the serial
+        # lock so submitting work never waits on an in-flight CLI session
+        self._worker_lock = threading.Lock()
+        self._worker_thread = None
+        # port -> (vlan, expiry) cache for get_port_vlan; the server is the
+        # only writer, so entries are refreshed on assign and expire as a
+        # safety net against out-of-band changes
+        self._vlan_cache: Dict[str, Tuple[str, float]] = {}
+        self._vlan_cache_ttl = 30.0
+
+    def start_worker(self) -> None:
+        """Start the background thread that applies queued VLAN assignments"""
+        with self._worker_lock:
+            if self._worker_thread is None or not self._worker_thread.is_alive():
+                self._worker_thread = threading.Thread(
+                    target=self._worker_loop, name='cisco-vlan-worker', daemon=True
+                )
+                self._worker_thread.start()
+
+    def submit_port_to_vlan(self, port: str, vlan_id: str) -> None:
+        """
+        Queue a port-to-VLAN assignment for the background worker
+
+        Fire-and-forget: the HTTP handler returns immediately while the
+        worker thread performs the serial I/O and logs failures.
+
+        Args:
+            port: Port identifier (e.g., 'Gi1/0/35')
+            vlan_id: VLAN ID to assign
+        """
+        self.submit_port_vlan_batch([(port, vlan_id)])
+
+    def submit_port_vlan_batch(self, assignments: List[Tuple[str, str]]) -> None:
+        """
+        Queue a batch of port-to-VLAN assignments as one CLI transaction
+
+        Args:
+            assignments: Ordered (port, vlan_id) pairs applied in a single
+                configuration session
+        """
+        if not assignments:
+            return
+        self.start_worker()
+        self._vlan_queue.put(list(assignments))
+
+    def _worker_loop(self) -> None:
+        """Consume queued VLAN assignment batches and apply them to the switch"""
+        while True:
+            assignments = self._vlan_queue.get()
+            # Coalesce everything queued behind this batch into the same CLI
+            # session, keeping only the last VLAN written per port, so a burst
+            # of submissions costs one config session instead of one each
+            drained = 0
+            merged = dict(assignments)
+            while True:
+                try:
+                    extra = self._vlan_queue.get_nowait()
+                except queue.Empty:
+                    break
+                merged.update(extra)
+                drained += 1
+            assignments = list(merged.items())
+            ports = ', '.join(port for port, _ in assignments)
+            try:
+                if self.is_connected:
+                    if not self.assign_ports_to_vlans(assignments):
+                        logger.error("Background VLAN assignment failed for ports: %s", ports)
+                else:
+                    logger.warning("Switch not connected, dropping VLAN assignment for ports: %s", ports)
+            except Exception as e:
+                logger.error("Background VLAN assignment for ports %s failed: %s", ports, e)
+            finally:
+                self._vlan_queue.task_done()
+                for _ in range(drained):
+                    self._vlan_queue.task_done()
+
     def connect(self) -> bool:
         """Establish serial connection to the switch"""
         try:
@@ -50,14 +162,20 @@ class CiscoWorker:
             self.connection.flushOutput()
             return True
         except Exception as e:
-            print(f"Failed to connect to serial port {self.serial_port}: {e}")
+            logger.error("Failed to connect to serial port %s: %s", self.serial_port, e)
             return False
     
+    @property
+    def is_connected(self) -> bool:
+        """Whether the serial connection to the switch is open"""
+        return self.connection is not None and self.connection.is_open
+
     def disconnect(self):
-        """Close serial connection"""
-        if self.connection and self.connection.is_open:
-            self.connection.close()
-            self.connection = None
+        """Close serial connection, waiting for any in-flight command to finish"""
+        with self._serial_lock:
+            if self.is_connected:
+                self.connection.close()
+                self.connection = None
     
     def send_command(self, command: str, wait_time: float = 0.5) -> str:
         """
@@ -70,28 +188,59 @@ class CiscoWorker:
         Returns:
             Response from the switch
         """
-        if not self.connection or not self.connection.is_open:
+        return self.send_commands([command], wait_time=wait_time)
+
+    def send_commands(self, commands: List[str], wait_time: float = 0.5) -> str:
+        """
+        Send several commands in one serial write and return the combined response
+
+        The console echoes and runs each line in order, so a multi-line
+        packet costs one write plus one read instead of a round-trip per
+        command.
+
+        Args:
+            commands: Cisco IOS commands, executed in order
+            wait_time: Time to wait after sending the packet (seconds)
+
+        Returns:
+            Combined response from the switch
+        """
+        if not self.is_connected:
             raise ConnectionError("Not connected to switch")
         
-        # Clear input buffer
-        self.connection.flushInput()
-        
-        # Send command with newline
-        command_bytes = (command + '\r\n').encode('utf-8')
-        self.connection.write(command_bytes)
-        time.sleep(wait_time)
-        
-        # Read response
-        response = b''
-        start_time = time.time()
-        while time.time() - start_time < self.timeout:
-            if self.connection.in_waiting > 0:
-                response += self.connection.read(self.connection.in_waiting)
-                time.sleep(0.1)
-            else:
-                break
-        
-        return response.decode('utf-8', errors='ignore')
+        with self._serial_lock:
+            # Clear input buffer
+            self.connection.flushInput()
+            
+            # Send all commands as one packet
+            command_bytes = ('\r\n'.join(commands) + '\r\n').encode('utf-8')
+            self.connection.write(command_bytes)
+            
+            # Read until the switch goes idle, blocking inside pyserial
+            # instead of polling in_waiting with sleeps: wait the full
+            # deadline for the first byte, then only the idle gap between
+            # bursts, and drain whatever else is buffered after each byte
+            response = bytearray()
+            deadline = time.time() + max(self.timeout, wait_time)
+            idle_gap = 0.05
+            original_timeout = self.connection.timeout
+            try:
+                while True:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self.connection.timeout = min(idle_gap, remaining) if response else remaining
+                    chunk = self.connection.read(1)
+                    if not chunk:
+                        break
+                    response += chunk
+                    waiting = self.connection.in_waiting
+                    if waiting:
+                        response += self.connection.read(waiting)
+            finally:
+                self.connection.timeout = original_timeout
+            
+            return response.decode('utf-8', errors='ignore')
     
     def enable_mode(self, enable_password: Optional[str] = None) -> bool:
         """
@@ -182,7 +331,7 @@ class CiscoWorker:
             # Verify VLAN was created
             return self.vlan_exists(vlan_id)
         except Exception as e:
-            print(f"Error creating VLAN {vlan_id}: {e}")
+            logger.error("Error creating VLAN %s: %s", vlan_id, e)
             if was_in_config:
                 self.exit_config_mode()
             return False
@@ -198,55 +347,125 @@ class CiscoWorker:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            print(f"[DEBUG] Starting assign_port_to_vlan: port={port}, vlan={vlan_id}")
-            
-            # Ensure VLAN exists
-            print(f"[DEBUG] Checking/creating VLAN {vlan_id}...")
-            if not self.create_vlan(vlan_id):
-                print(f"[ERROR] Failed to create VLAN {vlan_id}")
-                return False
-            print(f"[DEBUG] VLAN {vlan_id} ready")
+        with self._serial_lock:
+            try:
+                logger.debug("Starting assign_port_to_vlan: port=%s, vlan=%s", port, vlan_id)
             
-            was_in_config = False
-            # Enter config mode if not already
-            response = self.send_command("")
-            if "#" not in response:
-                print(f"[DEBUG] Entering enable mode...")
-                if not self.enable_mode():
-                    print(f"[ERROR] Failed to enter enable mode")
+                # Ensure VLAN exists
+                logger.debug("Checking/creating VLAN %s...", vlan_id)
+                if not self.create_vlan(vlan_id):
+                    logger.error("Failed to create VLAN %s", vlan_id)
                     return False
+                logger.debug("VLAN %s ready", vlan_id)
             
-            response = self.send_command("")
-            if CONFIG_INDICATOR not in response.lower():
-                print(f"[DEBUG] Entering config mode...")
-                self.configure_terminal()
-                was_in_config = True
+                was_in_config = False
+                # Enter config mode if not already
+                response = self.send_command("")
+                if "#" not in response:
+                    logger.debug("Entering enable mode...")
+                    if not self.enable_mode():
+                        logger.error("Failed to enter enable mode")
+                        return False
             
-            # Configure port
-            print(f"[DEBUG] Configuring interface {port}...")
-            self.send_command(f"interface {port}", wait_time=0.3)
-            self.send_command("switchport mode access", wait_time=0.3)
-            print(f"[DEBUG] Setting VLAN {vlan_id} on port {port}...")
-            self.send_command(f"switchport access vlan {vlan_id}", wait_time=0.3)
-            self.send_command("no shutdown", wait_time=0.3)
-            print(f"[DEBUG] Port {port} configured successfully")
+                response = self.send_command("")
+                if CONFIG_INDICATOR not in response.lower():
+                    logger.debug("Entering config mode...")
+                    self.configure_terminal()
+                    was_in_config = True
             
-            if was_in_config:
-                self.exit_config_mode()
-            else:
-                self.send_command("end")
+                # Configure port: one packet instead of four round trips
+                logger.debug("Configuring interface %s for VLAN %s...", port, vlan_id)
+                self.send_commands([
+                    f"interface {port}",
+                    "switchport mode access",
+                    f"switchport access vlan {vlan_id}",
+                    "no shutdown",
+                ], wait_time=0.3)
+                logger.debug("Port %s configured successfully", port)
+            
+                if was_in_config:
+                    self.exit_config_mode()
+                else:
+                    self.send_command("end")
             
-            print(f"[SUCCESS] Port {port} assigned to VLAN {vlan_id}")
+                logger.info("Port %s assigned to VLAN %s", port, vlan_id)
+                self._vlan_cache[port] = (vlan_id, time.time() + self._vlan_cache_ttl)
+                return True
+            except Exception as e:
+                logger.error("Error assigning port %s to VLAN %s: %s", port, vlan_id, e)
+                try:
+                    self.exit_config_mode()
+                except Exception:
+                    pass
+                return False
+    
+    def assign_ports_to_vlans(self, assignments: List[Tuple[str, str]]) -> bool:
+        """
+        Assign multiple ports to VLANs in a single configuration session
+
+        Enters config mode once, applies every (port, vlan) pair in order,
+        then exits, instead of paying the enable/config round-trips per port.
+
+        Args:
+            assignments: Ordered (port, vlan_id) pairs
+
+        Returns:
+            True if all assignments were applied, False otherwise
+        """
+        if not assignments:
             return True
-        except Exception as e:
-            print(f"[ERROR] Error assigning port {port} to VLAN {vlan_id}: {e}")
+        with self._serial_lock:
             try:
-                self.exit_config_mode()
-            except Exception:
-                pass
-            return False
-    
+                was_in_config = False
+                response = self.send_command("")
+                if "#" not in response:
+                    if not self.enable_mode():
+                        logger.error("Failed to enter enable mode")
+                        return False
+
+                # One 'show vlan brief' replaces a vlan_exists probe per
+                # assignment; missing VLANs are created inside the session
+                brief = self.send_command("show vlan brief", wait_time=1.0)
+                existing_vlans = {match['id'] for match in VLAN_BRIEF_ROW_RE.finditer(brief)}
+                missing_vlans = []
+                for _, vlan_id in assignments:
+                    if vlan_id not in existing_vlans and vlan_id not in missing_vlans:
+                        missing_vlans.append(vlan_id)
+
+                response = self.send_command("")
+                if CONFIG_INDICATOR not in response.lower():
+                    self.configure_terminal()
+                    was_in_config = True
+
+                # VLAN creates plus all port configs go out as a single packet
+                commands = [f"vlan {vlan_id}" for vlan_id in missing_vlans]
+                for port, vlan_id in assignments:
+                    commands.extend([
+                        f"interface {port}",
+                        "switchport mode access",
+                        f"switchport access vlan {vlan_id}",
+                        "no shutdown",
+                    ])
+                self.send_commands(commands, wait_time=0.5)
+
+                if was_in_config:
+                    self.exit_config_mode()
+                else:
+                    self.send_command("end")
+
+                logger.info("Applied %s port VLAN assignments in one session", len(assignments))
+                expiry = time.time() + self._vlan_cache_ttl
+                for port, vlan_id in assignments:
+                    self._vlan_cache[port] = (vlan_id, expiry)
+                return True
+            except Exception as e:
+                logger.error("Error applying batched VLAN assignments: %s", e)
+                try:
+                    self.exit_config_mode()
+                except Exception:
+                    pass
+                return False
+
     def get_port_vlan(self, port: str) -> Optional[str]:
         """
         Get the VLAN assigned to a port
@@ -257,16 +476,19 @@ class CiscoWorker:
         Returns:
             VLAN ID if found, None otherwise
         """
+        cached = self._vlan_cache.get(port)
+        if cached and time.time() < cached[1]:
+            return cached[0]
+
         response = self.send_command(f"show interfaces {port} switchport")
         
         # Parse VLAN from output
         # Look for "Access Mode VLAN: X" or similar
-        match = re.search(r'Access Mode VLAN:\s*(\d+)', response, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        
-        match = re.search(r'VLAN\s+(\d+)', response, re.IGNORECASE)
+        match = ACCESS_VLAN_RE.search(response)
+        if not match:
+            match = VLAN_RE.search(response)
         if match:
+            self._vlan_cache[port] = (match.group(1), time.time() + self._vlan_cache_ttl)
             return match.group(1)
         
         return None
@@ -281,7 +503,12 @@ class CiscoWorker:
         Returns:
             Dictionary with port status information
         """
-        response = self.send_command(f"show interfaces {port} status")
+        # One packet for both queries instead of separate status, get_port_vlan
+        # and switchport round trips over the same output
+        response = self.send_commands([
+            f"show interfaces {port} status",
+            f"show interfaces {port} switchport",
+        ])
         
         status_info = {
             'port': port,
@@ -298,19 +525,35 @@ class CiscoWorker:
         elif 'notconnect' in response.lower() or 'down' in response.lower():
             status_info['status'] = 'inactive'
         
-        # Get VLAN
-        vlan = self.get_port_vlan(port)
-        if vlan:
-            status_info['vlan'] = vlan
-        
-        # Try to get more details from switchport command
-        switchport_response = self.send_command(f"show interfaces {port} switchport")
-        vlan_match = re.search(r'Access Mode VLAN:\s*(\d+)', switchport_response, re.IGNORECASE)
+        # Parse VLAN from the switchport section of the same response
+        vlan_match = ACCESS_VLAN_RE.search(response)
+        if not vlan_match:
+            vlan_match = VLAN_RE.search(response)
         if vlan_match:
             status_info['vlan'] = vlan_match.group(1)
+            self._vlan_cache[port] = (vlan_match.group(1), time.time() + self._vlan_cache_ttl)
         
         return status_info
     
+    def get_all_port_vlans(self) -> Dict[str, str]:
+        """
+        Get the access VLAN of every port in one CLI round-trip
+
+        Sends a single 'show interfaces status' instead of one
+        'show interfaces <port> switchport' per port.
+
+        Returns:
+            Dictionary mapping port identifier to VLAN ID
+        """
+        response = self.send_command("show interfaces status", wait_time=1.0)
+
+        vlans = {}
+        for match in STATUS_ROW_RE.finditer(response):
+            if match['vlan'].isdigit():
+                vlans[match['port']] = match['vlan']
+
+        return vlans
+
     def get_all_ports_status(self) -> List[Dict[str, str]]:
         """
         Get status of all ports on the switch
@@ -321,28 +564,28 @@ class CiscoWorker:
         response = self.send_command("show interfaces status")
         
         ports = []
-        lines = response.split('\n')
-        
-        for line in lines:
-            # Parse port status line
-            # Format typically: Gi1/0/1  connected  trunk    a-full  a-1000  10/100/1000BaseTX
-            parts = line.split()
-            if len(parts) >= 2 and ('Gi' in parts[0] or 'Fa' in parts[0] or 'Te' in parts[0]):
-                port = parts[0]
-                status = 'active' if 'connected' in line.lower() or 'up' in line.lower() else 'inactive'
-                
-                port_info = {
-                    'port': port,
-                    'status': status,
-                    'vlan': None
-                }
-                
-                # Get VLAN for this port
-                vlan = self.get_port_vlan(port)
-                if vlan:
-                    port_info['vlan'] = vlan
-                
-                ports.append(port_info)
+        vlan_cache_expiry = time.time() + self._vlan_cache_ttl
+        # Rows look like: Gi1/0/1  name  connected  200  a-full  a-1000 ...
+        for match in STATUS_ROW_RE.finditer(response):
+            port = match['port']
+            status = 'active' if match['status'].lower() == 'connected' else 'inactive'
+            
+            port_info = {
+                'port': port,
+                'status': status,
+                'vlan': None
+            }
+            
+            # The Vlan column in this output already carries the access
+            # VLAN; only trunk/routed entries (non-numeric) still need a
+            # per-port switchport query
+            if match['vlan'].isdigit():
+                port_info['vlan'] = match['vlan']
+                self._vlan_cache[port] = (match['vlan'], vlan_cache_expiry)
+            else:
+                port_info['vlan'] = self.get_port_vlan(port)
+            
+            ports.append(port_info)
         
         return ports
     
@@ -358,38 +601,41 @@ class CiscoWorker:
             if not self.connection or not self.connection.is_open:
                 if not self.connect():
                     return False
-            
+
             if not self.enable_mode():
-                print("Failed to enter enable mode")
+                logger.error("Failed to enter enable mode")
                 return False
-            
+
+            # A full resync supersedes anything previously cached
+            self._vlan_cache.clear()
+
             # Get all boxes and screens from DB
             boxes = self.box_service.get_all_boxes()
             screens = self.screen_service.get_all_screens()
             
-            # Process screens (fixed VLANs)
+            # Collect every port's target VLAN, then apply the whole sync
+            # as one config session instead of a session per record
+            assignments = []
             for screen in screens:
                 port = screen.get('port_number')
                 vlan = screen.get('vlan_number')
-                
                 if port and vlan:
-                    print(f"Syncing screen port {port} to VLAN {vlan}")
-                    if not self.assign_port_to_vlan(port, vlan):
-                        print(f"Failed to sync screen port {port}")
-            
-            # Process boxes (dynamic VLANs, default to 1)
+                    assignments.append((port, vlan))
             for box in boxes:
                 port = box.get('port_number')
                 vlan = box.get('vlan_number') or self.default_box_vlan
-                
                 if port:
-                    print(f"Syncing box port {port} to VLAN {vlan}")
-                    if not self.assign_port_to_vlan(port, vlan):
-                        print(f"Failed to sync box port {port}")
+                    assignments.append((port, vlan))
             
+            if not assignments:
+                return True
+            logger.info("Syncing %s ports with the database in one session", len(assignments))
+            if not self.assign_ports_to_vlans(assignments):
+                logger.error("Failed to sync port VLANs with the database")
+                return False
             return True
         except Exception as e:
-            print(f"Error syncing with DB: {e}")
+            logger.error("Error syncing with DB: %s", e)
             return False
     
     def assign_box_to_screen_vlan(self, box_port: str, screen_vlan: str) -> bool:
@@ -427,19 +673,13 @@ class CiscoWorker:
             
             # Get VLAN list
             response = self.send_command("show vlan brief")
-            vlan_lines = response.split('\n')
-            for line in vlan_lines:
-                # Parse VLAN line
-                parts = line.split()
-                if len(parts) >= 2 and parts[0].isdigit():
-                    vlan_id = parts[0]
-                    vlan_name = parts[1] if len(parts) > 1 else f"VLAN{vlan_id}"
-                    info['vlans'].append({
-                        'id': vlan_id,
-                        'name': vlan_name
-                    })
+            for match in VLAN_BRIEF_ROW_RE.finditer(response):
+                info['vlans'].append({
+                    'id': match['id'],
+                    'name': match['name']
+                })
         except Exception as e:
-            print(f"Error getting switch info: {e}")
+            logger.error("Error getting switch info: %s", e)
         
         return info
 
@@ -1,15 +1,27 @@
-from tinydb import TinyDB, Query
+from tinydb import Query
+
+from services.db import get_db, get_db_lock
 from typing import Optional, Dict
 
 
 class ConfigService:
     """Service layer for configuration management database operations"""
-    
+
+    __slots__ = ('db', 'config_table', 'config_query', '_config_cache', '_lock')
+
     def __init__(self, db_path: str = 'boxes.json'):
         """Initialize the service with database connection"""
-        self.db = TinyDB(db_path)
+        self.db = get_db(db_path)
+        # TinyDB is not thread-safe; table writes and cache snapshots run
+        # under the per-file lock shared with the other services
+        self._lock = get_db_lock(db_path)
         self.config_table = self.db.table('config')
         self.config_query = Query()
+        # Full config snapshot, loaded once at startup; set_config keeps it
+        # current, so single-key reads never touch the table again
+        with self._lock:
+            self._config_cache: Dict[str, Optional[str]] = {
+                item['key']: item.get('value') for item in self.config_table.all()}
     
     def get_config(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -22,10 +34,8 @@ class ConfigService:
         Returns:
             Configuration value or default
         """
-        result = self.config_table.search(self.config_query.key == key)
-        if result:
-            return result[0].get('value', default)
-        return default
+        value = self._config_cache.get(key)
+        return value if value is not None else default
     
     def set_config(self, key: str, value: str) -> bool:
         """
@@ -38,11 +48,15 @@ class ConfigService:
         Returns:
             True if successful
         """
-        # Remove existing entry if it exists
-        self.config_table.remove(self.config_query.key == key)
-        # Insert new entry
-        self.config_table.insert({'key': key, 'value': value})
-        return True
+        with self._lock:
+            # No-op writes skip the file rewrite entirely; the cache holds
+            # the complete table, so no existence probe is needed
+            if self._config_cache.get(key) == value:
+                return True
+            # One upsert instead of remove + insert
+            self.config_table.upsert({'key': key, 'value': value}, self.config_query.key == key)
+            self._config_cache[key] = value
+            return True
     
     def get_serial_port(self, default: str = 'COM4') -> str:
         """
@@ -75,6 +89,7 @@ class ConfigService:
         Returns:
             Dictionary of all configuration key-value pairs
         """
-        all_config = self.config_table.all()
-        return {item['key']: item['value'] for item in all_config}
+        # Copying iterates the cache, so it must not race a set_config insert
+        with self._lock:
+            return dict(self._config_cache)
 
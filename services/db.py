@@ -0,0 +1,89 @@
+import atexit
+import logging
+import threading
+import time
+
+from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import JSONStorage
+
+logger = logging.getLogger(__name__)
+
+# Process-wide TinyDB handles keyed by path. TinyDB keeps per-table query
+# caches that only see writes made through the same instance, so services
+# must share one handle per file for those caches to stay coherent (and to
+# avoid parsing the same JSON file once per service at startup)
+_db_lock = threading.Lock()
+_db_instances = {}
+
+# Per-file RLocks shared by every service on the same database. TinyDB
+# itself is not thread-safe (doc_id allocation is an unlocked
+# read-increment, and searches iterate the live storage dict), so under a
+# threaded server every table mutation, search and cache/index rebuild
+# must run inside this lock. Reentrant because service methods nest
+# (e.g. an assign calls its own get under the lock)
+_db_rw_locks = {}
+
+# How long a completed write may sit in memory before the background
+# flusher pushes it to disk; this bounds the data lost to a hard crash
+FLUSH_INTERVAL = 0.5
+
+_flush_thread = None
+
+
+def _flush_all():
+    """Flush every open database's write cache to disk"""
+    with _db_lock:
+        dbs = list(_db_instances.items())
+    for db_path, db in dbs:
+        try:
+            # Serializing the cache iterates the live storage dict, so the
+            # flush must hold the same lock the services write under
+            with get_db_lock(db_path):
+                db.storage.flush()
+        except Exception as e:
+            # A flush that keeps failing stretches the durability window
+            # past FLUSH_INTERVAL indefinitely; make that visible
+            logger.error("Failed to flush %s to disk: %s", db_path, e)
+
+
+def _flush_loop():
+    """Periodically flush deferred writes so mutators never block on disk"""
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        _flush_all()
+
+
+def _ensure_flusher():
+    """Start the background flush thread once (caller holds _db_lock)"""
+    global _flush_thread
+    if _flush_thread is None:
+        _flush_thread = threading.Thread(
+            target=_flush_loop, name='tinydb-flusher', daemon=True)
+        _flush_thread.start()
+        atexit.register(_flush_all)
+
+
+def get_db_lock(db_path: str) -> threading.RLock:
+    """Return the shared read/write lock for a database file"""
+    with _db_lock:
+        lock = _db_rw_locks.get(db_path)
+        if lock is None:
+            lock = threading.RLock()
+            _db_rw_locks[db_path] = lock
+        return lock
+
+
+def get_db(db_path: str) -> TinyDB:
+    """Return the shared TinyDB instance for a database file, opening it once"""
+    with _db_lock:
+        db = _db_instances.get(db_path)
+        if db is None:
+            # CachingMiddleware serves reads from memory instead of
+            # re-reading the JSON file on every query, and batches writes
+            # so mutators return after the in-memory update; the flusher
+            # thread persists them within FLUSH_INTERVAL
+            db = TinyDB(db_path, storage=CachingMiddleware(JSONStorage))
+            _db_instances[db_path] = db
+            _ensure_flusher()
+        return db
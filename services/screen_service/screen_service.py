@@ -1,24 +1,60 @@
-from tinydb import TinyDB, Query
-from typing import Optional, List, Dict
+import threading
+
+from tinydb import Query
+
+from services.db import get_db, get_db_lock
+from typing import Optional, List, Dict, Tuple
 
 
 class ScreenService:
     """Service layer for screen management database operations"""
-    
+
+    __slots__ = ('db', 'screens_table', 'screen_query', '_q_free', '_q_assigned', '_q_with_port',
+                 '_screen_cache', '_box_cache', '_list_cache',
+                 '_screen_index', '_box_index', '_next_id', '_id_lock', '_lock')
+
     def __init__(self, db_path: str = 'boxes.json'):
         """Initialize the service with database connection"""
-        self.db = TinyDB(db_path)
+        self.db = get_db(db_path)
+        # TinyDB is not thread-safe; every table access and cache rebuild
+        # runs under the per-file lock shared with the other services
+        self._lock = get_db_lock(db_path)
         self.screens_table = self.db.table('screens')
         self.screen_query = Query()
-    
+        # Precompiled query conditions, built once instead of per call
+        self._q_free = (self.screen_query.box_id == None)
+        self._q_assigned = (self.screen_query.box_id != None)
+        self._q_with_port = (self.screen_query.port_number.exists()
+                             & (self.screen_query.port_number != None)
+                             & (self.screen_query.port_number != ''))
+        # In-memory read caches, invalidated on every mutation
+        self._screen_cache: Dict[int, Dict] = {}
+        self._box_cache: Dict[int, Dict] = {}
+        self._list_cache: Dict[str, List[Dict]] = {}
+        # screen_id/box_id -> doc_id indexes, rebuilt lazily after a mutation
+        self._screen_index: Optional[Dict[int, int]] = None
+        self._box_index: Optional[Dict[int, int]] = None
+        # Next screen ID, computed once instead of a max() scan per insert.
+        # Monotonic: deleting a screen never frees its ID for reuse
+        with self._lock:
+            self._next_id = 1 + max((screen.get('screen_id', 0) for screen in self.screens_table.all()), default=0)
+        self._id_lock = threading.Lock()
+
+    def _invalidate_cache(self) -> None:
+        """Drop all cached lookups after a mutation (caller holds _lock)"""
+        self._screen_cache.clear()
+        self._box_cache.clear()
+        self._list_cache.clear()
+        self._screen_index = None
+        self._box_index = None
+
     def _get_next_screen_id(self) -> int:
-        """Generate the next screen ID by finding the maximum existing ID + 1"""
-        all_screens = self.screens_table.all()
-        if not all_screens:
-            return 1
-        max_id = max(screen.get('screen_id', 0) for screen in all_screens)
-        return max_id + 1
-    
+        """Reserve and return the next screen ID"""
+        with self._id_lock:
+            next_id = self._next_id
+            self._next_id += 1
+            return next_id
+
     def create_screen(self, port_number: str, vlan_number: Optional[str] = None, screen_number: Optional[str] = None) -> Dict:
         """Create a new screen and return it"""
         screen_id = self._get_next_screen_id()
@@ -29,80 +65,158 @@ class ScreenService:
             'vlan_number': vlan_number,
             'box_id': None  # 1-to-1 relationship with box
         }
-        self.screens_table.insert(new_screen)
+        with self._lock:
+            self.screens_table.insert(new_screen)
+            self._invalidate_cache()
         return new_screen
-    
+
     def delete_screen(self, screen_id: int) -> bool:
         """Delete a screen by ID. Returns True if deleted, False if not found"""
-        result = self.screens_table.remove(self.screen_query.screen_id == screen_id)
+        with self._lock:
+            result = self.screens_table.remove(self.screen_query.screen_id == screen_id)
+            self._invalidate_cache()
         return len(result) > 0
-    
+
+    def _ensure_indexes(self) -> None:
+        """Rebuild the screen_id/box_id -> doc_id indexes in one table pass (caller holds _lock)"""
+        if self._screen_index is None:
+            screen_index: Dict[int, int] = {}
+            box_index: Dict[int, int] = {}
+            for screen in self.screens_table.all():
+                screen_index[screen.get('screen_id')] = screen.doc_id
+                if screen.get('box_id') is not None:
+                    box_index[screen['box_id']] = screen.doc_id
+            self._screen_index = screen_index
+            self._box_index = box_index
+
     def get_screen_by_id(self, screen_id: int) -> Optional[Dict]:
         """Get a screen by its ID. Returns None if not found"""
-        result = self.screens_table.search(self.screen_query['screen_id'] == screen_id)
-        return result[0] if result else None
-    
+        with self._lock:
+            if screen_id in self._screen_cache:
+                return self._screen_cache[screen_id]
+            self._ensure_indexes()
+            doc_id = self._screen_index.get(screen_id)
+            if doc_id is None:
+                return None
+            screen = self.screens_table.get(doc_id=doc_id)
+            if screen is not None:
+                self._screen_cache[screen_id] = screen
+            return screen
+
     def get_screen_by_box_id(self, box_id: int) -> Optional[Dict]:
         """Get a screen assigned to a specific box. Returns None if not found"""
-        result = self.screens_table.search(self.screen_query['box_id'] == box_id)
-        return result[0] if result else None
-    
+        with self._lock:
+            if box_id in self._box_cache:
+                return self._box_cache[box_id]
+            self._ensure_indexes()
+            doc_id = self._box_index.get(box_id)
+            if doc_id is None:
+                return None
+            screen = self.screens_table.get(doc_id=doc_id)
+            if screen is not None:
+                self._box_cache[box_id] = screen
+            return screen
+
     def get_all_screens(self) -> List[Dict]:
         """Get all screens"""
-        return self.screens_table.all()
-    
+        with self._lock:
+            if 'all' not in self._list_cache:
+                self._list_cache['all'] = self.screens_table.all()
+            return self._list_cache['all']
+
+    def get_all_screens_with_port(self) -> List[Dict]:
+        """Get all screens that have a port_number set"""
+        with self._lock:
+            if 'with_port' not in self._list_cache:
+                self._list_cache['with_port'] = self.screens_table.search(self._q_with_port)
+            return self._list_cache['with_port']
+
     def get_free_screens(self) -> List[Dict]:
         """Get all free screens (screens with box_id = None)"""
-        return self.screens_table.search(self.screen_query.box_id == None)
-    
+        with self._lock:
+            if 'free' not in self._list_cache:
+                self._list_cache['free'] = self.screens_table.search(self._q_free)
+            return self._list_cache['free']
+
     def assign_box_to_screen(self, box_id: int, screen_id: int) -> Optional[Dict]:
         """Assign a box to a specific screen (1-to-1). Returns the updated screen or None if not found"""
-        screen = self.get_screen_by_id(screen_id)
-        if not screen:
-            return None
-        if screen['box_id'] == box_id and screen['screen_id'] == screen_id:
-            return screen  # Already assigned to this box
-        # Check if screen is already assigned to a box
-        if screen['box_id'] is not None:
-            return None  # Indicates screen is already assigned
-        
-        # Check if box is already assigned to another screen
-        existing_screen = self.get_screen_by_box_id(box_id)
-        if existing_screen:
-            return None  # Box is already assigned to another screen
-        
-        # Assign box to screen
-        self.screens_table.update({'box_id': box_id}, self.screen_query["screen_id"] == screen_id)
-        screen['box_id'] = box_id
-        return screen
-    
+        with self._lock:
+            screen = self.get_screen_by_id(screen_id)
+            if not screen:
+                return None
+            if screen['box_id'] == box_id and screen['screen_id'] == screen_id:
+                return screen  # Already assigned to this box
+            # Check if screen is already assigned to a box
+            if screen['box_id'] is not None:
+                return None  # Indicates screen is already assigned
+
+            # Check if box is already assigned to another screen
+            existing_screen = self.get_screen_by_box_id(box_id)
+            if existing_screen:
+                return None  # Box is already assigned to another screen
+
+            # Assign box to screen
+            self.screens_table.update({'box_id': box_id}, self.screen_query["screen_id"] == screen_id)
+            self._invalidate_cache()
+            screen['box_id'] = box_id
+            return screen
+
+    def try_assign_box_to_screen(self, box_id: int, screen_id: int) -> Tuple[str, Optional[Dict]]:
+        """Assign a box to a screen (1-to-1) and report why it failed if it did.
+
+        Returns ('ok', screen), ('screen_missing', None), ('screen_taken', None)
+        or ('box_taken', None), so callers need no follow-up lookups.
+        """
+        with self._lock:
+            screen = self.get_screen_by_id(screen_id)
+            if not screen:
+                return 'screen_missing', None
+            if screen['box_id'] == box_id:
+                return 'ok', screen  # Already assigned to this box
+            if screen['box_id'] is not None:
+                return 'screen_taken', None
+            if self.get_screen_by_box_id(box_id):
+                return 'box_taken', None
+
+            self.screens_table.update({'box_id': box_id}, self.screen_query["screen_id"] == screen_id)
+            self._invalidate_cache()
+            screen['box_id'] = box_id
+            return 'ok', screen
+
     def unassign_box_from_screen(self, box_id: int) -> bool:
         """Unassign a box from its screen. Returns True if unassigned, False if box has no screen"""
-        result = self.screens_table.search(self.screen_query.box_id == box_id)
-        if not result:
-            return False
-        
-        self.screens_table.update({'box_id': None}, self.screen_query.box_id == box_id)
-        return True
-    
+        with self._lock:
+            # The update's affected doc_ids double as the existence check
+            updated = self.screens_table.update({'box_id': None}, self.screen_query.box_id == box_id)
+            if not updated:
+                return False
+            self._invalidate_cache()
+            return True
+
     def unassign_screen(self, screen_id: int) -> Optional[bool]:
         """Unassign a screen by screen_id. Returns True if unassigned, False if already free, None if not found"""
-        screen = self.get_screen_by_id(screen_id)
-        if not screen:
-            return None
-        
-        if screen['box_id'] is None:
-            return False  # Already free
-        
-        self.screens_table.update({'box_id': None}, self.screen_query.screen_id == screen_id)
-        return True
-    
+        with self._lock:
+            # One conditional update covers the assigned case; only the two
+            # no-op outcomes need the (indexed) existence lookup
+            updated = self.screens_table.update(
+                {'box_id': None},
+                (self.screen_query.screen_id == screen_id) & self._q_assigned)
+            if updated:
+                self._invalidate_cache()
+                return True
+            return False if self.get_screen_by_id(screen_id) else None
+
+    def unassign_all_screens(self) -> List[Dict]:
+        """Unassign every screen in one update. Returns the screens that were assigned"""
+        with self._lock:
+            assigned = self.screens_table.search(self._q_assigned)
+            if assigned:
+                self.screens_table.update({'box_id': None}, self._q_assigned)
+                self._invalidate_cache()
+            return assigned
+
     def update_screen(self, screen_id: int, screen_number: Optional[str] = None, port_number: Optional[str] = None, vlan_number: Optional[str] = None) -> Optional[Dict]:
         """Update screen attributes. Returns the updated screen or None if not found"""
-        screen = self.get_screen_by_id(screen_id)
-        if not screen:
-            return None
-        
         update_data = {}
         if screen_number is not None:
             update_data['screen_number'] = screen_number
@@ -110,13 +224,19 @@ class ScreenService:
             update_data['port_number'] = port_number
         if vlan_number is not None:
             update_data['vlan_number'] = vlan_number
-        
-        if not update_data:
-            return screen  # No updates to make, return existing screen
-        
-        self.screens_table.update(update_data, self.screen_query['screen_id'] == screen_id)
-        
-        # Return updated screen
-        updated_screen = self.get_screen_by_id(screen_id)
-        return updated_screen
 
+        with self._lock:
+            screen = self.get_screen_by_id(screen_id)
+            if not screen:
+                return None
+
+            if not update_data:
+                return screen  # No updates to make, return existing screen
+
+            self.screens_table.update(update_data, self.screen_query['screen_id'] == screen_id)
+            self._invalidate_cache()
+
+            # The stored row now matches the fetched dict plus the update; merge
+            # locally instead of re-reading the table
+            screen.update(update_data)
+            return screen
@@ -1,12 +1,17 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QTableWidget, QTableWidgetItem, QPushButton, QLineEdit,
     QLabel, QMessageBox, QDialog, QFormLayout, QComboBox, QGroupBox,
     QTextEdit, QHeaderView, QSplitter, QCheckBox, QProgressDialog
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
+from PySide6.QtCore import Qt, QTimer, QThread, QThreadPool, QRunnable, QObject, Signal
 from typing import Optional, Dict, List
 
 
@@ -15,6 +20,124 @@ class BaseURL:
     BASE_URL = "http://localhost:5000"
 
 
+def parse_json(response):
+    """Decode a response body with orjson instead of requests' stdlib json"""
+    return orjson.loads(response.content)
+
+
+def parse_error(response) -> str:
+    """Extract an error message without assuming the body is JSON"""
+    try:
+        return parse_json(response).get('error', 'Unknown error')
+    except (orjson.JSONDecodeError, AttributeError):
+        return response.text[:200] or 'Unknown error'
+
+
+@contextmanager
+def bulk_table_update(table):
+    """Suspend repaints and item signals while a table is repopulated
+
+    Each setItem otherwise triggers its own change signal and relayout;
+    batching them repaints the table once per refresh instead of once
+    per cell.
+    """
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
+def make_session() -> requests.Session:
+    """Build a pooled keep-alive session for API calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                          max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# One pooled session shared by the UI and its worker threads: every call
+# targets the same host, so keep-alive skips the TCP handshake per request
+SESSION = make_session()
+
+# Per-endpoint request timeouts, most specific substring first; anything
+# not listed uses the default
+ENDPOINT_TIMEOUTS = (
+    ('/ports_vlan', 30),
+    ('/switch/', 3),
+)
+DEFAULT_TIMEOUT = 5
+
+
+class ApiWorkerSignals(QObject):
+    """Signals for ApiWorker (QRunnable cannot carry signals itself)"""
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class ApiWorker(QRunnable):
+    """Run a single API request on the global thread pool
+
+    Keeps the Qt event loop free while the request is in flight; results
+    are delivered back on the GUI thread through queued signals.
+    """
+    
+    def __init__(self, method: str, endpoint: str, data: Optional[Dict] = None, timeout: int = 5):
+        super().__init__()
+        self.method = method
+        self.endpoint = endpoint
+        self.data = data
+        self.timeout = timeout
+        self.signals = ApiWorkerSignals()
+    
+    def run(self):
+        try:
+            url = f"{BaseURL.BASE_URL}{self.endpoint}"
+            response = SESSION.request(self.method, url, json=self.data, timeout=self.timeout)
+            if response.status_code in [200, 201]:
+                self.signals.finished.emit(parse_json(response))
+            else:
+                self.signals.failed.emit(parse_error(response))
+        except requests.exceptions.Timeout:
+            self.signals.failed.emit(f"Request to {self.endpoint} timed out")
+        except requests.exceptions.RequestException as e:
+            self.signals.failed.emit(f"Failed to connect to server: {str(e)}")
+
+
+class MultiGetWorker(QRunnable):
+    """Fetch several independent endpoints concurrently on the thread pool
+
+    Emits a single {endpoint: parsed JSON or None} dict once every request
+    has finished, so views needing data from multiple endpoints pay one
+    round-trip of latency instead of one per endpoint.
+    """
+    
+    def __init__(self, endpoints: List[str], timeout: int = 5):
+        super().__init__()
+        self.endpoints = endpoints
+        self.timeout = timeout
+        self.signals = ApiWorkerSignals()
+    
+    def run(self):
+        def fetch(endpoint):
+            try:
+                timeout = 3 if '/switch/' in endpoint else self.timeout
+                response = SESSION.get(f"{BaseURL.BASE_URL}{endpoint}", timeout=timeout)
+                if response.status_code == 200:
+                    return parse_json(response)
+            except requests.exceptions.RequestException:
+                pass
+            return None
+        
+        with ThreadPoolExecutor(max_workers=len(self.endpoints)) as pool:
+            results = dict(zip(self.endpoints, pool.map(fetch, self.endpoints)))
+        self.signals.finished.emit(results)
+
+
 class SwitchStatusThread(QThread):
     """Background thread for checking switch status"""
     status_updated = Signal(dict)
@@ -28,12 +151,12 @@ class SwitchStatusThread(QThread):
     def run(self):
         """Run the background thread"""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{self.base_url}/switch/info",
                 timeout=2
             )
             if response.status_code == 200:
-                self.status_updated.emit(response.json())
+                self.status_updated.emit(parse_json(response))
             else:
                 self.error_occurred.emit("Failed to get switch status")
         except requests.exceptions.Timeout:
@@ -54,16 +177,23 @@ class SyncVLANsThread(QThread):
     def __init__(self, base_url: str):
         super().__init__()
         self.base_url = base_url
+        self.cancelled = False
+    
+    def cancel(self):
+        """Drop the result of the in-flight request; nobody is listening"""
+        self.cancelled = True
     
     def run(self):
         """Run the sync operation"""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{self.base_url}/switch/ports_vlans",
                 timeout=180
             )
+            if self.cancelled:
+                return
             if response.status_code == 200:
-                self.sync_completed.emit(response.json())
+                self.sync_completed.emit(parse_json(response))
             else:
                 self.error_occurred.emit(f"Failed to sync VLANs: {response.status_code}")
         except requests.exceptions.Timeout:
@@ -80,16 +210,23 @@ class ResetVLANsThread(QThread):
     def __init__(self, base_url: str):
         super().__init__()
         self.base_url = base_url
+        self.cancelled = False
+    
+    def cancel(self):
+        """Drop the result of the in-flight request; nobody is listening"""
+        self.cancelled = True
     
     def run(self):
         """Run the reset operation"""
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{self.base_url}/screens/reset_all_vlans",
                 timeout=120
             )
+            if self.cancelled:
+                return
             if response.status_code == 200:
-                self.reset_completed.emit(response.json())
+                self.reset_completed.emit(parse_json(response))
             else:
                 self.error_occurred.emit(f"Failed to reset VLANs: {response.status_code}")
         except requests.exceptions.Timeout:
@@ -106,16 +243,23 @@ class UnassignAllThread(QThread):
     def __init__(self, base_url: str):
         super().__init__()
         self.base_url = base_url
+        self.cancelled = False
+    
+    def cancel(self):
+        """Drop the result of the in-flight request; nobody is listening"""
+        self.cancelled = True
     
     def run(self):
         """Run the unassign all operation"""
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{self.base_url}/screens/unassign_all",
                 timeout=120
             )
+            if self.cancelled:
+                return
             if response.status_code == 200:
-                self.unassign_completed.emit(response.json())
+                self.unassign_completed.emit(parse_json(response))
             else:
                 self.error_occurred.emit(f"Failed to remove assignments: {response.status_code}")
         except requests.exceptions.Timeout:
@@ -272,11 +416,20 @@ class AssignBoxToScreenDialog(QDialog):
 class BackofficeUI(QMainWindow):
     """Main backoffice UI window"""
     
+    # Auto-refresh cadence; errors back the interval off exponentially
+    BASE_REFRESH_INTERVAL_MS = 10000
+    MAX_REFRESH_INTERVAL_MS = 60000
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Box Server - Backoffice")
         self.setGeometry(100, 100, 1400, 900)
         
+        # Row caches filled by the refresh paths so per-action lookups
+        # (edit, reconfigure) don't re-fetch lists the tables already show
+        self._screens_cache: Dict[int, Dict] = {}
+        self._boxes_cache: Dict[int, Dict] = {}
+        
         # Switch status cache
         self.last_switch_status = None
         self.switch_refresh_enabled = False
@@ -285,6 +438,7 @@ class BackofficeUI(QMainWindow):
         self.setup_ui()
         
         # Setup non-blocking refresh timer for switch (disabled by default)
+        self.refresh_interval = self.BASE_REFRESH_INTERVAL_MS
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_switch_status_background)
         # Don't start timer by default - user must enable it
@@ -541,7 +695,8 @@ class BackofficeUI(QMainWindow):
         """Toggle automatic switch status refresh"""
         if state == Qt.CheckState.Checked.value:
             self.switch_refresh_enabled = True
-            self.refresh_timer.start(10000)  # Refresh every 10 seconds
+            self.refresh_interval = self.BASE_REFRESH_INTERVAL_MS
+            self.refresh_timer.start(self.refresh_interval)
             self.refresh_switch_status_background()
         else:
             self.switch_refresh_enabled = False
@@ -553,26 +708,16 @@ class BackofficeUI(QMainWindow):
         try:
             url = f"{BaseURL.BASE_URL}{endpoint}"
             # Use shorter timeout for switch operations to prevent blocking
-            timeout = 3 if '/switch/' in endpoint else 5
-            timeout = 30 if '/ports_vlan' in endpoint else timeout
+            timeout = next((t for part, t in ENDPOINT_TIMEOUTS if part in endpoint), DEFAULT_TIMEOUT)
             
-            if method == "GET":
-                response = requests.get(url, timeout=timeout)
-            elif method == "POST":
-                response = requests.post(url, json=data, timeout=timeout)
-            elif method == "PUT":
-                response = requests.put(url, json=data, timeout=timeout)
-            elif method == "PATCH":
-                response = requests.patch(url, json=data, timeout=timeout)
-            elif method == "DELETE":
-                response = requests.delete(url, timeout=timeout)
-            else:
+            if method not in ("GET", "POST", "PUT", "PATCH", "DELETE"):
                 return None
+            response = SESSION.request(method, url, json=data, timeout=timeout)
             
             if response.status_code in [200, 201]:
-                return response.json()
+                return parse_json(response)
             else:
-                error_msg = response.json().get('error', 'Unknown error')
+                error_msg = parse_error(response)
                 if show_error:
                     QMessageBox.warning(self, "Error", f"API Error: {error_msg}")
                 return None
@@ -585,32 +730,65 @@ class BackofficeUI(QMainWindow):
                 QMessageBox.warning(self, "Connection Error", f"Failed to connect to server: {str(e)}")
             return None
     
+    @staticmethod
+    def set_cell(table, row: int, col: int, text: str):
+        """Update a cell in place, only allocating an item on first fill
+
+        Auto-refresh repopulates tables often; reusing the existing
+        QTableWidgetItem avoids churning an item per cell per refresh.
+        """
+        item = table.item(row, col)
+        if item is None:
+            table.setItem(row, col, QTableWidgetItem(text))
+        elif item.text() != text:
+            item.setText(text)
+    
+    def fetch_async(self, endpoint: str, on_result, show_error: bool = False):
+        """GET an endpoint on the thread pool and deliver the result to a slot"""
+        worker = ApiWorker("GET", endpoint)
+        worker.signals.finished.connect(on_result)
+        if show_error:
+            worker.signals.failed.connect(self._on_api_error)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_api_error(self, error: str):
+        QMessageBox.warning(self, "Error", f"API Error: {error}")
+    
     # Screen methods
     def refresh_screens(self):
-        screens = self.api_request("GET", "/screens")
+        self.fetch_async("/screens", self._populate_screens)
+    
+    def _populate_screens(self, screens):
         if screens:
-            self.screens_table.setRowCount(len(screens))
-            for row, screen in enumerate(screens):
-                self.screens_table.setItem(row, 0, QTableWidgetItem(str(screen.get('screen_id', ''))))
-                self.screens_table.setItem(row, 1, QTableWidgetItem(str(screen.get('screen_number', ''))))
-                self.screens_table.setItem(row, 2, QTableWidgetItem(str(screen.get('port_number', ''))))
-                self.screens_table.setItem(row, 3, QTableWidgetItem(str(screen.get('vlan_number', '') or '')))
-                self.screens_table.setItem(row, 4, QTableWidgetItem(''))  # Actual VLAN - will be filled by sync
-                self.screens_table.setItem(row, 5, QTableWidgetItem(str(screen.get('box_id', '') or '')))
+            self._screens_cache = {s.get('screen_id'): s for s in screens}
+            with bulk_table_update(self.screens_table):
+                self.screens_table.setRowCount(len(screens))
+                for row, screen in enumerate(screens):
+                    self.set_cell(self.screens_table, row, 0, str(screen.get('screen_id', '')))
+                    self.set_cell(self.screens_table, row, 1, str(screen.get('screen_number', '')))
+                    self.set_cell(self.screens_table, row, 2, str(screen.get('port_number', '')))
+                    self.set_cell(self.screens_table, row, 3, str(screen.get('vlan_number', '') or ''))
+                    self.set_cell(self.screens_table, row, 4, '')  # Actual VLAN - will be filled by sync
+                    self.set_cell(self.screens_table, row, 5, str(screen.get('box_id', '') or ''))
     
     def add_screen(self):
+        # open() returns immediately; queued background signals keep
+        # draining while the dialog is up (exec() would block the loop)
         dialog = AddEditScreenDialog(self)
-        if dialog.exec():
-            data = dialog.get_data()
-            if not data.get('port_number'):
-                QMessageBox.warning(self, "Validation Error", "Port number is required")
-                return
-            
-            result = self.api_request("POST", "/screens", data)
-            if result:
-                QMessageBox.information(self, "Success", "Screen added successfully")
-                self.refresh_screens()
-                self.refresh_assignments()
+        dialog.accepted.connect(lambda: self._save_new_screen(dialog))
+        dialog.open()
+    
+    def _save_new_screen(self, dialog):
+        data = dialog.get_data()
+        if not data.get('port_number'):
+            QMessageBox.warning(self, "Validation Error", "Port number is required")
+            return
+        
+        result = self.api_request("POST", "/screens", data)
+        if result:
+            QMessageBox.information(self, "Success", "Screen added successfully")
+            self.refresh_screens()
+            self.refresh_assignments()
     
     def edit_screen(self):
         selected = self.screens_table.currentRow()
@@ -619,21 +797,24 @@ class BackofficeUI(QMainWindow):
             return
         
         screen_id = int(self.screens_table.item(selected, 0).text())
-        screen_data = None
         
-        # Get current screen data
-        result = self.api_request("GET", f"/screens/{screen_id}")
-        if result:
-            screen_data = result
+        # The refresh path already cached the row; only fall back to the
+        # API if it is somehow missing
+        screen_data = self._screens_cache.get(screen_id)
+        if not screen_data:
+            screen_data = self.api_request("GET", f"/screens/{screen_id}")
         
         dialog = AddEditScreenDialog(self, screen_data)
-        if dialog.exec():
-            data = dialog.get_data()
-            result = self.api_request("PUT", f"/screens/{screen_id}", data)
-            if result:
-                QMessageBox.information(self, "Success", "Screen updated successfully")
-                self.refresh_screens()
-                self.refresh_assignments()
+        dialog.accepted.connect(lambda: self._save_edited_screen(dialog, screen_id))
+        dialog.open()
+    
+    def _save_edited_screen(self, dialog, screen_id):
+        data = dialog.get_data()
+        result = self.api_request("PUT", f"/screens/{screen_id}", data)
+        if result:
+            QMessageBox.information(self, "Success", "Screen updated successfully")
+            self.refresh_screens()
+            self.refresh_assignments()
     
     def delete_screen(self):
         selected = self.screens_table.currentRow()
@@ -666,14 +847,8 @@ class BackofficeUI(QMainWindow):
         screen_id = int(self.screens_table.item(selected, 0).text())
         screen_port = self.screens_table.item(selected, 2).text()
         
-        # Get screen data
-        screen = None
-        screens = self.api_request("GET", "/screens")
-        if screens:
-            for s in screens:
-                if s.get('screen_id') == screen_id:
-                    screen = s
-                    break
+        # Get screen data from the refresh cache
+        screen = self._screens_cache.get(screen_id)
         
         if not screen:
             QMessageBox.warning(self, "Error", "Screen not found")
@@ -684,13 +859,7 @@ class BackofficeUI(QMainWindow):
         # Determine target VLAN
         if box_id:
             # Screen is assigned to a box, use box's VLAN
-            boxes = self.api_request("GET", "/boxes")
-            box = None
-            if boxes:
-                for b in boxes:
-                    if b.get('box_id') == box_id:
-                        box = b
-                        break
+            box = self._boxes_cache.get(box_id)
             
             if not box:
                 QMessageBox.warning(self, "Error", "Assigned box not found")
@@ -746,8 +915,10 @@ class BackofficeUI(QMainWindow):
             progress.setMinimumDuration(0)
             progress.setCancelButton(None)  # Cannot cancel this operation
             progress.setValue(0)
+            # The modal dialog paints once control returns to the event
+            # loop right after the worker starts; re-entering the loop
+            # with processEvents here could run arbitrary queued slots
             progress.show()
-            QApplication.processEvents()
             
             # Create and start worker thread
             self.reset_thread = ResetVLANsThread(BaseURL.BASE_URL)
@@ -764,8 +935,8 @@ class BackofficeUI(QMainWindow):
         progress.setMinimumDuration(0)
         progress.setCancelButton(None)  # Cannot cancel this operation
         progress.setValue(0)
+        # See reset_all_screen_vlans: no processEvents before thread start
         progress.show()
-        QApplication.processEvents()
         
         # Create and start worker thread
         self.sync_thread = SyncVLANsThread(BaseURL.BASE_URL)
@@ -785,35 +956,37 @@ class BackofficeUI(QMainWindow):
         
         # Update screens table
         updated_screens = 0
-        for row in range(self.screens_table.rowCount()):
-            screen_id_item = self.screens_table.item(row, 0)
-            if screen_id_item:
-                screen_id = int(screen_id_item.text())
-                # Try both integer and string keys
-                actual_vlan = screens_vlans.get(screen_id) or screens_vlans.get(str(screen_id))
-                if actual_vlan:
-                    self.screens_table.setItem(row, 4, QTableWidgetItem(str(actual_vlan)))
-                    updated_screens += 1
-                    print(f"[DEBUG] Updated screen {screen_id} with VLAN {actual_vlan}")
-                else:
-                    self.screens_table.setItem(row, 4, QTableWidgetItem('N/A'))
-                    print(f"[DEBUG] No VLAN found for screen {screen_id}")
+        with bulk_table_update(self.screens_table):
+            for row in range(self.screens_table.rowCount()):
+                screen_id_item = self.screens_table.item(row, 0)
+                if screen_id_item:
+                    screen_id = int(screen_id_item.text())
+                    # Try both integer and string keys
+                    actual_vlan = screens_vlans.get(screen_id) or screens_vlans.get(str(screen_id))
+                    if actual_vlan:
+                        self.set_cell(self.screens_table, row, 4, str(actual_vlan))
+                        updated_screens += 1
+                        print(f"[DEBUG] Updated screen {screen_id} with VLAN {actual_vlan}")
+                    else:
+                        self.set_cell(self.screens_table, row, 4, 'N/A')
+                        print(f"[DEBUG] No VLAN found for screen {screen_id}")
         
         # Update boxes table
         updated_boxes = 0
-        for row in range(self.boxes_table.rowCount()):
-            box_id_item = self.boxes_table.item(row, 0)
-            if box_id_item:
-                box_id = int(box_id_item.text())
-                # Try both integer and string keys
-                actual_vlan = boxes_vlans.get(box_id) or boxes_vlans.get(str(box_id))
-                if actual_vlan:
-                    self.boxes_table.setItem(row, 4, QTableWidgetItem(str(actual_vlan)))
-                    updated_boxes += 1
-                    print(f"[DEBUG] Updated box {box_id} with VLAN {actual_vlan}")
-                else:
-                    self.boxes_table.setItem(row, 4, QTableWidgetItem('N/A'))
-                    print(f"[DEBUG] No VLAN found for box {box_id}")
+        with bulk_table_update(self.boxes_table):
+            for row in range(self.boxes_table.rowCount()):
+                box_id_item = self.boxes_table.item(row, 0)
+                if box_id_item:
+                    box_id = int(box_id_item.text())
+                    # Try both integer and string keys
+                    actual_vlan = boxes_vlans.get(box_id) or boxes_vlans.get(str(box_id))
+                    if actual_vlan:
+                        self.set_cell(self.boxes_table, row, 4, str(actual_vlan))
+                        updated_boxes += 1
+                        print(f"[DEBUG] Updated box {box_id} with VLAN {actual_vlan}")
+                    else:
+                        self.set_cell(self.boxes_table, row, 4, 'N/A')
+                        print(f"[DEBUG] No VLAN found for box {box_id}")
         
         QMessageBox.information(self, "Success", 
             f"Synced VLANs from switch:\n{updated_screens} screens updated\n{updated_boxes} boxes updated")
@@ -842,33 +1015,40 @@ class BackofficeUI(QMainWindow):
     
     # Box methods
     def refresh_boxes(self):
-        boxes = self.api_request("GET", "/boxes")
+        self.fetch_async("/boxes", self._populate_boxes)
+    
+    def _populate_boxes(self, boxes):
         if boxes:
-            self.boxes_table.setRowCount(len(boxes))
-            for row, box in enumerate(boxes):
-                self.boxes_table.setItem(row, 0, QTableWidgetItem(str(box.get('box_id', ''))))
-                self.boxes_table.setItem(row, 1, QTableWidgetItem(str(box.get('box_number', ''))))
-                self.boxes_table.setItem(row, 2, QTableWidgetItem(str(box.get('port_number', ''))))
-                self.boxes_table.setItem(row, 3, QTableWidgetItem(str(box.get('vlan_number', '') or '')))
-                self.boxes_table.setItem(row, 4, QTableWidgetItem(''))  # Actual VLAN - will be filled by sync
-                self.boxes_table.setItem(row, 5, QTableWidgetItem(str(box.get('user_id', '') or '')))
+            self._boxes_cache = {b.get('box_id'): b for b in boxes}
+            with bulk_table_update(self.boxes_table):
+                self.boxes_table.setRowCount(len(boxes))
+                for row, box in enumerate(boxes):
+                    self.set_cell(self.boxes_table, row, 0, str(box.get('box_id', '')))
+                    self.set_cell(self.boxes_table, row, 1, str(box.get('box_number', '')))
+                    self.set_cell(self.boxes_table, row, 2, str(box.get('port_number', '')))
+                    self.set_cell(self.boxes_table, row, 3, str(box.get('vlan_number', '') or ''))
+                    self.set_cell(self.boxes_table, row, 4, '')  # Actual VLAN - will be filled by sync
+                    self.set_cell(self.boxes_table, row, 5, str(box.get('user_id', '') or ''))
     
     def add_box(self):
         dialog = AddEditBoxDialog(self)
-        if dialog.exec():
-            data = dialog.get_data()
-            if not data.get('port_number') or not data.get('box_number'):
-                QMessageBox.warning(self, "Validation Error", "Port number and box number are required")
-                return
-            if not data.get('vlan_number'):
-                QMessageBox.warning(self, "Validation Error", "VLAN number is required")
-                return
-            
-            result = self.api_request("POST", "/boxes", data)
-            if result:
-                QMessageBox.information(self, "Success", "Box added successfully")
-                self.refresh_boxes()
-                self.refresh_assignments()
+        dialog.accepted.connect(lambda: self._save_new_box(dialog))
+        dialog.open()
+    
+    def _save_new_box(self, dialog):
+        data = dialog.get_data()
+        if not data.get('port_number') or not data.get('box_number'):
+            QMessageBox.warning(self, "Validation Error", "Port number and box number are required")
+            return
+        if not data.get('vlan_number'):
+            QMessageBox.warning(self, "Validation Error", "VLAN number is required")
+            return
+        
+        result = self.api_request("POST", "/boxes", data)
+        if result:
+            QMessageBox.information(self, "Success", "Box added successfully")
+            self.refresh_boxes()
+            self.refresh_assignments()
     
     def edit_box(self):
         selected = self.boxes_table.currentRow()
@@ -877,24 +1057,21 @@ class BackofficeUI(QMainWindow):
             return
         
         box_id = int(self.boxes_table.item(selected, 0).text())
-        box_data = None
         
-        # Get current box data
-        boxes = self.api_request("GET", "/boxes")
-        if boxes:
-            for box in boxes:
-                if box.get('box_id') == box_id:
-                    box_data = box
-                    break
+        # The refresh path already cached the row
+        box_data = self._boxes_cache.get(box_id)
         
         dialog = AddEditBoxDialog(self, box_data)
-        if dialog.exec():
-            data = dialog.get_data()
-            result = self.api_request("PUT", f"/boxes/{box_id}", data)
-            if result:
-                QMessageBox.information(self, "Success", "Box updated successfully")
-                self.refresh_boxes()
-                self.refresh_assignments()
+        dialog.accepted.connect(lambda: self._save_edited_box(dialog, box_id))
+        dialog.open()
+    
+    def _save_edited_box(self, dialog, box_id):
+        data = dialog.get_data()
+        result = self.api_request("PUT", f"/boxes/{box_id}", data)
+        if result:
+            QMessageBox.information(self, "Success", "Box updated successfully")
+            self.refresh_boxes()
+            self.refresh_assignments()
     
     def delete_box(self):
         selected = self.boxes_table.currentRow()
@@ -919,46 +1096,61 @@ class BackofficeUI(QMainWindow):
     
     # Assignment methods
     def refresh_assignments(self):
-        screens = self.api_request("GET", "/screens")
+        worker = MultiGetWorker(["/screens", "/boxes"])
+        worker.signals.finished.connect(self._populate_assignments)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _populate_assignments(self, results):
+        screens = results.get("/screens")
         if screens:
             assignments = [s for s in screens if s.get('box_id') is not None]
-            self.assignments_table.setRowCount(len(assignments))
-            
-            boxes = self.api_request("GET", "/boxes")
+            boxes = results.get("/boxes")
             boxes_dict = {box.get('box_id'): box for box in boxes} if boxes else {}
             
-            for row, screen in enumerate(assignments):
-                box_id = screen.get('box_id')
-                box = boxes_dict.get(box_id, {})
-                
-                self.assignments_table.setItem(row, 0, QTableWidgetItem(str(screen.get('screen_id', ''))))
-                self.assignments_table.setItem(row, 1, QTableWidgetItem(str(screen.get('screen_number', '') or '')))
-                self.assignments_table.setItem(row, 2, QTableWidgetItem(str(screen.get('port_number', ''))))
-                self.assignments_table.setItem(row, 3, QTableWidgetItem(str(box_id)))
-                self.assignments_table.setItem(row, 4, QTableWidgetItem(str(box.get('box_number', '') or '')))
-                self.assignments_table.setItem(row, 5, QTableWidgetItem(str(box.get('port_number', '') or '')))
+            with bulk_table_update(self.assignments_table):
+                self.assignments_table.setRowCount(len(assignments))
+                for row, screen in enumerate(assignments):
+                    box_id = screen.get('box_id')
+                    box = boxes_dict.get(box_id, {})
+                    
+                    self.set_cell(self.assignments_table, row, 0, str(screen.get('screen_id', '')))
+                    self.set_cell(self.assignments_table, row, 1, str(screen.get('screen_number', '') or ''))
+                    self.set_cell(self.assignments_table, row, 2, str(screen.get('port_number', '')))
+                    self.set_cell(self.assignments_table, row, 3, str(box_id))
+                    self.set_cell(self.assignments_table, row, 4, str(box.get('box_number', '') or ''))
+                    self.set_cell(self.assignments_table, row, 5, str(box.get('port_number', '') or ''))
     
     def assign_box_to_screen(self):
-        boxes = self.api_request("GET", "/boxes")
-        screens = self.api_request("GET", "/screens")
+        # Fetch both lists concurrently off the GUI thread, then open the
+        # dialog once they arrive
+        worker = MultiGetWorker(["/boxes", "/screens"])
+        worker.signals.finished.connect(self._open_assign_dialog)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _open_assign_dialog(self, results):
+        boxes = results.get("/boxes")
+        screens = results.get("/screens")
         
         if not boxes or not screens:
             QMessageBox.warning(self, "Error", "Failed to load boxes or screens")
             return
         
         dialog = AssignBoxToScreenDialog(self, boxes, screens)
-        if dialog.exec():
-            box_id, screen_id = dialog.get_selection()
-            if box_id and screen_id:
-                result = self.api_request("POST", "/screens/assign", {
-                    'box_id': box_id,
-                    'screen_id': screen_id
-                })
-                if result:
-                    QMessageBox.information(self, "Success", "Box assigned to screen successfully")
-                    self.refresh_assignments()
-                    self.refresh_screens()
-                    self.refresh_boxes()
+        dialog.accepted.connect(lambda: self._save_assignment(dialog))
+        dialog.open()
+    
+    def _save_assignment(self, dialog):
+        box_id, screen_id = dialog.get_selection()
+        if box_id and screen_id:
+            result = self.api_request("POST", "/screens/assign", {
+                'box_id': box_id,
+                'screen_id': screen_id
+            })
+            if result:
+                QMessageBox.information(self, "Success", "Box assigned to screen successfully")
+                self.refresh_assignments()
+                self.refresh_screens()
+                self.refresh_boxes()
     
     def unassign_box_from_screen(self):
         selected = self.assignments_table.currentRow()
@@ -1003,8 +1195,10 @@ class BackofficeUI(QMainWindow):
             progress.setMinimumDuration(0)
             progress.setCancelButton(None)  # Cannot cancel this operation
             progress.setValue(0)
+            # The modal dialog paints once control returns to the event
+            # loop right after the worker starts; re-entering the loop
+            # with processEvents here could run arbitrary queued slots
             progress.show()
-            QApplication.processEvents()
             
             # Create and start worker thread
             self.unassign_all_thread = UnassignAllThread(BaseURL.BASE_URL)
@@ -1046,6 +1240,14 @@ class BackofficeUI(QMainWindow):
     
     def update_switch_status_ui(self, info: dict):
         """Update UI with switch status from background thread"""
+        # A successful poll resets any error backoff
+        if self.switch_refresh_enabled and self.refresh_interval != self.BASE_REFRESH_INTERVAL_MS:
+            self.refresh_interval = self.BASE_REFRESH_INTERVAL_MS
+            self.refresh_timer.start(self.refresh_interval)
+        # Auto-refresh polls every 10s; skip the table rebuild when the
+        # switch reports the same state as last time
+        if info == self.last_switch_status:
+            return
         self.last_switch_status = info
         connected = info.get('connected', False)
         status_text = "Connected" if connected else "Not Connected"
@@ -1053,11 +1255,12 @@ class BackofficeUI(QMainWindow):
         
         # Update ports table
         ports = info.get('ports', [])
-        self.switch_ports_table.setRowCount(len(ports))
-        for row, port in enumerate(ports):
-            self.switch_ports_table.setItem(row, 0, QTableWidgetItem(str(port.get('port', ''))))
-            self.switch_ports_table.setItem(row, 1, QTableWidgetItem(str(port.get('status', ''))))
-            self.switch_ports_table.setItem(row, 2, QTableWidgetItem(str(port.get('vlan', '') or '')))
+        with bulk_table_update(self.switch_ports_table):
+            self.switch_ports_table.setRowCount(len(ports))
+            for row, port in enumerate(ports):
+                self.set_cell(self.switch_ports_table, row, 0, str(port.get('port', '')))
+                self.set_cell(self.switch_ports_table, row, 1, str(port.get('status', '')))
+                self.set_cell(self.switch_ports_table, row, 2, str(port.get('vlan', '') or ''))
     
     def handle_switch_error(self, error: str):
         """Handle switch status error from background thread"""
@@ -1066,6 +1269,12 @@ class BackofficeUI(QMainWindow):
         else:
             self.switch_status_label.setText("Status: Not Connected (Timeout)")
         
+        # Back off while the endpoint keeps failing so polls don't stack
+        # up behind a slow or dead switch; the next success resets it
+        if self.switch_refresh_enabled:
+            self.refresh_interval = min(self.refresh_interval * 2, self.MAX_REFRESH_INTERVAL_MS)
+            self.refresh_timer.start(self.refresh_interval)
+        
         # Don't clear the table, keep last known state
     
     def refresh_switch_status_manual(self):
@@ -1126,9 +1335,14 @@ class BackofficeUI(QMainWindow):
     
     # Overview methods
     def refresh_overview(self):
-        boxes = self.api_request("GET", "/boxes", show_error=False)
-        screens = self.api_request("GET", "/screens", show_error=False)
-        switch_info = self.api_request("GET", "/switch/info", show_error=False)
+        worker = MultiGetWorker(["/boxes", "/screens", "/switch/info"])
+        worker.signals.finished.connect(self._populate_overview)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _populate_overview(self, results):
+        boxes = results.get("/boxes")
+        screens = results.get("/screens")
+        switch_info = results.get("/switch/info")
         
         if not boxes or not screens:
             self.overview_text.setText("Failed to load data")
@@ -1198,6 +1412,20 @@ class BackofficeUI(QMainWindow):
         
         self.overview_text.setText(overview)
     
+    def closeEvent(self, event):
+        """Stop polling and orphan in-flight workers before the window dies"""
+        self.refresh_timer.stop()
+        for thread in (self.switch_status_thread,
+                       getattr(self, 'sync_thread', None),
+                       getattr(self, 'reset_thread', None),
+                       getattr(self, 'unassign_all_thread', None)):
+            if thread and thread.isRunning():
+                if hasattr(thread, 'cancel'):
+                    thread.cancel()
+                else:
+                    thread.stop()
+        super().closeEvent(event)
+    
     def refresh_all(self):
         """Refresh all tabs - load critical data first, switch status is optional"""
         # Load critical data first (these should always work)
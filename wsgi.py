@@ -0,0 +1,12 @@
+"""WSGI entry point for serving the app outside the built-in dev server.
+
+Example:
+    gunicorn -c gunicorn_conf.py wsgi:application
+"""
+import threading
+
+from app import app as application, initialize_switch
+
+# Kick off switch connect/sync in the background so the server accepts
+# requests (and readiness probes) immediately after binding.
+threading.Thread(target=initialize_switch, name='switch-init', daemon=True).start()